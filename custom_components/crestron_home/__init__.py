@@ -1,25 +1,24 @@
 """Crestron Home integration."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Mapping
+from dataclasses import dataclass
 import logging
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_VERIFY_SSL, Platform
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ConfigEntryNotReady
 
-from .api import ApiClient
-from .calibration import parse_calibration_options
+from .api import ApiClient, CrestronHomeApiError
+from .calibration import CalibrationCollection, parse_calibration_options
 from .const import (
     CONF_API_TOKEN,
-    DATA_API_CLIENT,
-    DATA_CALIBRATIONS,
-    DATA_PREDICTIVE_MANAGER,
-    DATA_PREDICTIVE_STORAGE,
-    DATA_SHADES_COORDINATOR,
-    DATA_WRITE_BATCHER,
+    CONF_INVERT,
+    DEFAULT_INVERT,
     DEFAULT_VERIFY_SSL,
-    DOMAIN,
     OPT_PREDICTIVE_STOP,
     PREDICTIVE_DEFAULT_ENABLED,
     PREDICTIVE_DIAGNOSTIC_HISTORY,
@@ -41,13 +40,32 @@ from .write import ShadeWriteBatcher
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [Platform.COVER]
+PLATFORMS: tuple[Platform, ...] = (Platform.COVER,)
 
+# Options applied to the running entry without a reload.
+_LIVE_OPTIONS = frozenset({OPT_PREDICTIVE_STOP})
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Set up Crestron Home from a config entry."""
+# The options flow writes these defaults into entries that never stored them,
+# so a missing key must compare equal to its default.
+_OPTION_DEFAULTS: dict[str, Any] = {CONF_INVERT: DEFAULT_INVERT}
+
+
+@dataclass(frozen=True, slots=True)
+class CrestronHomeRuntimeData:
+    """Runtime objects shared by the platforms of a config entry."""
 
-    hass.data.setdefault(DOMAIN, {})
+    client: ApiClient
+    coordinator: ShadesCoordinator
+    batcher: ShadeWriteBatcher
+    calibrations: CalibrationCollection
+    predictive: PredictiveRuntime
+    predictive_store: PredictiveStopStore
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry[CrestronHomeRuntimeData]
+) -> bool:
+    """Set up Crestron Home from a config entry."""
 
     host = entry.data[CONF_HOST]
     api_token = entry.data[CONF_API_TOKEN]
@@ -62,7 +80,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         version=PREDICTIVE_STORAGE_VERSION,
         key_prefix=PREDICTIVE_STORAGE_KEY_PREFIX,
     )
-    stored = await predictive_store.async_load()
+    # Loading learned parameters from disk and authenticating with the controller are
+    # independent, so overlap them; the first refresh then reuses the auth key.
+    try:
+        stored, _ = await asyncio.gather(
+            predictive_store.async_load(),
+            client.async_login(),
+        )
+    except CrestronHomeApiError as err:
+        raise ConfigEntryNotReady(str(err)) from err
+
     learning_defaults = {
         "v0": 0.4,
         "v1": 0.0,
@@ -101,23 +128,46 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         on_flush=coordinator.handle_write_flush,
     )
 
-    hass.data[DOMAIN][entry.entry_id] = {
-        DATA_API_CLIENT: client,
-        DATA_SHADES_COORDINATOR: coordinator,
-        DATA_WRITE_BATCHER: batcher,
-        DATA_CALIBRATIONS: calibrations,
-        DATA_PREDICTIVE_MANAGER: predictive_runtime,
-        DATA_PREDICTIVE_STORAGE: predictive_store,
-    }
+    entry.runtime_data = CrestronHomeRuntimeData(
+        client=client,
+        coordinator=coordinator,
+        batcher=batcher,
+        calibrations=calibrations,
+        predictive=predictive_runtime,
+        predictive_store=predictive_store,
+    )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    applied_data = dict(entry.data)
+    applied_options = dict(entry.options)
+
+    async def _async_update_listener(
+        hass: HomeAssistant, entry: ConfigEntry[CrestronHomeRuntimeData]
+    ) -> None:
+        """Handle config entry updates (options)."""
+
+        nonlocal applied_options
+
+        if entry.data != applied_data or _options_require_reload(
+            applied_options, entry.options
+        ):
+            await hass.config_entries.async_reload(entry.entry_id)
+            return
+
+        predictive_runtime.enabled = entry.options.get(
+            OPT_PREDICTIVE_STOP, PREDICTIVE_DEFAULT_ENABLED
+        )
+        applied_options = dict(entry.options)
+
     entry.async_on_unload(entry.add_update_listener(_async_update_listener))
 
     return True
 
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_unload_entry(
+    hass: HomeAssistant, entry: ConfigEntry[CrestronHomeRuntimeData]
+) -> bool:
     """Unload a Crestron Home config entry."""
 
     _LOGGER.debug("Unload requested for config entry %s", entry.entry_id)
@@ -126,36 +176,32 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if not unload_ok:
         return False
 
-    domain_data: dict[str, Any] | None = hass.data.get(DOMAIN)
-    if domain_data is None:
-        return True
-
-    stored = domain_data.pop(entry.entry_id, {})
-    batcher: ShadeWriteBatcher | None = stored.get(DATA_WRITE_BATCHER)
-    if batcher is not None:
-        await batcher.async_shutdown()
-
-    predictive_store: PredictiveStopStore | None = stored.get(DATA_PREDICTIVE_STORAGE)
-    predictive_runtime: PredictiveRuntime | None = stored.get(DATA_PREDICTIVE_MANAGER)
-    if predictive_store and predictive_runtime:
-        await predictive_store.async_save(
+    runtime_data = entry.runtime_data
+    # Draining queued writes and persisting learned parameters are independent, but
+    # logout clears the auth key the batcher may still need, so it runs last.
+    await asyncio.gather(
+        runtime_data.batcher.async_shutdown(),
+        runtime_data.predictive_store.async_save(
             PredictiveStoreData(
                 version=PREDICTIVE_STORAGE_VERSION,
-                shades=predictive_runtime.serialize_learning(),
+                shades=runtime_data.predictive.serialize_learning(),
             )
-        )
-
-    client: ApiClient | None = stored.get(DATA_API_CLIENT)
-    if client is not None:
-        await client.async_logout()
+        ),
+    )
 
-    if not domain_data:
-        hass.data.pop(DOMAIN)
+    await runtime_data.client.async_logout()
 
     return True
 
 
-async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
-    """Handle config entry updates (options)."""
+def _options_require_reload(
+    previous: Mapping[str, Any], current: Mapping[str, Any]
+) -> bool:
+    """Return True if an option other than a live-applied one changed."""
 
-    await hass.config_entries.async_reload(entry.entry_id)
+    return any(
+        previous.get(key, _OPTION_DEFAULTS.get(key))
+        != current.get(key, _OPTION_DEFAULTS.get(key))
+        for key in previous.keys() | current.keys()
+        if key not in _LIVE_OPTIONS
+    )
@@ -4,19 +4,22 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, NamedTuple
 
-from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout, ContentTypeError
+import orjson
+from aiohttp import ClientError, ClientResponseError, ClientSession, ClientTimeout
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_create_clientsession, async_get_clientsession
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     DEFAULT_VERIFY_SSL,
     HEADER_ACCEPT,
     HEADER_AUTH_KEY,
     HEADER_AUTH_TOKEN,
+    HEADER_CONTENT_TYPE,
     MIME_TYPE_JSON,
     PATH_LOGIN,
     PATH_ROOMS,
@@ -30,6 +33,17 @@ _LOGGER = logging.getLogger(__name__)
 HTTP_UNAUTHORIZED = 401
 HTTP_NETWORK_AUTH_REQUIRED = 511
 
+_DEFAULT_TIMEOUT = ClientTimeout(total=REQUEST_TIMEOUT)
+
+# Controllers almost always report these exact spellings; returning the shared
+# constants skips strip/lower allocations for each shade entry.
+_CANONICAL_STATUSES = {
+    status: status for status in ("success", "failure", "partial")
+}
+
+_MESSAGE_KEYS = ("message", "error", "reason", "details")
+_MESSAGE_KEY_SET = frozenset(_MESSAGE_KEYS)
+
 
 class CrestronHomeApiError(Exception):
     """Base exception raised for API client errors."""
@@ -47,8 +61,7 @@ class ShadeCommandFailedError(CrestronHomeApiError):
     """Raised when a SetState command fails for all shades."""
 
 
-@dataclass(slots=True)
-class ShadeCommandResult:
+class ShadeCommandResult(NamedTuple):
     """Result for a single shade command."""
 
     status: str
@@ -63,6 +76,73 @@ class ShadeCommandResponse:
     results: dict[str, ShadeCommandResult]
 
 
+def _normalize_status(value: Any) -> str | None:
+    if type(value) is str:
+        if (canonical := _CANONICAL_STATUSES.get(value)) is not None:
+            return canonical
+        return value.strip().lower() or None
+    if value is None:
+        return None
+    if isinstance(value, str):
+        return value.strip().lower() or None
+    if isinstance(value, (bool, int, float)):
+        return "success" if value else "failure"
+    return None
+
+
+def _extract_message(entry: dict[str, Any]) -> str | None:
+    # Successful entries rarely carry any of these keys.
+    if entry.keys().isdisjoint(_MESSAGE_KEY_SET):
+        return None
+    for key in _MESSAGE_KEYS:
+        value = entry.get(key)
+        if isinstance(value, str) and value.strip():
+            return value.strip()
+    return None
+
+
+def _parse_result_list(
+    raw_results: list[Any], fallback: str
+) -> dict[str, ShadeCommandResult]:
+    results: dict[str, ShadeCommandResult] = {}
+    for entry in raw_results:
+        if not isinstance(entry, dict):
+            continue
+        raw_id = entry.get("id")
+        if raw_id is None:
+            continue
+        entry_status = _normalize_status(entry.get("status"))
+        if entry_status is None and "success" in entry:
+            entry_status = "success" if entry["success"] else "failure"
+        if entry_status is None and "result" in entry:
+            entry_status = _normalize_status(entry["result"])
+        results[str(raw_id)] = ShadeCommandResult(
+            status=entry_status or fallback,
+            message=_extract_message(entry),
+        )
+    return results
+
+
+def _parse_result_dict(
+    raw_results: dict[Any, Any], fallback: str
+) -> dict[str, ShadeCommandResult]:
+    results: dict[str, ShadeCommandResult] = {}
+    for raw_id, entry in raw_results.items():
+        if isinstance(entry, dict):
+            entry_status = _normalize_status(entry.get("status"))
+            if entry_status is None and "success" in entry:
+                entry_status = "success" if entry["success"] else "failure"
+            message = _extract_message(entry)
+        else:
+            entry_status = _normalize_status(entry)
+            message = None
+        results[str(raw_id)] = ShadeCommandResult(
+            status=entry_status or fallback,
+            message=message,
+        )
+    return results
+
+
 class ApiClient:
     """Client wrapping the Crestron Home REST API."""
 
@@ -80,8 +160,15 @@ class ApiClient:
         self._verify_ssl = verify_ssl
         self._session: ClientSession | None = None
         self._auth_key: str | None = None
-        self._timeout = ClientTimeout(total=REQUEST_TIMEOUT)
-        self._last_used: float | None = None
+        self._base_url = f"https://{host}"
+        self._urls: dict[str, str] = {}
+        self._list_keys: dict[str, str] = {}
+        self._login_headers = {
+            HEADER_ACCEPT: MIME_TYPE_JSON,
+            HEADER_AUTH_TOKEN: api_token,
+        }
+        self._auth_headers: dict[str, str] | None = None
+        self._auth_post_headers: dict[str, str] | None = None
         self._login_lock = asyncio.Lock()
 
     @property
@@ -91,133 +178,169 @@ class ApiClient:
         return self._host
 
     def _build_url(self, path: str) -> str:
-        return f"https://{self._host}{path}"
+        url = self._urls.get(path)
+        if url is None:
+            url = self._urls[path] = self._base_url + path
+        return url
+
+    def _set_auth_key(self, auth_key: str | None) -> None:
+        self._auth_key = auth_key
+        if auth_key is None:
+            self._auth_headers = None
+            self._auth_post_headers = None
+            return
+
+        self._auth_headers = {
+            HEADER_ACCEPT: MIME_TYPE_JSON,
+            HEADER_AUTH_KEY: auth_key,
+        }
+        self._auth_post_headers = {
+            **self._auth_headers,
+            HEADER_CONTENT_TYPE: MIME_TYPE_JSON,
+        }
 
     def _ensure_session(self) -> ClientSession:
         if self._session is not None:
             return self._session
 
-        if self._verify_ssl:
-            self._session = async_get_clientsession(self._hass)
-        else:
-            self._session = async_create_clientsession(self._hass, verify_ssl=False)
-
+        # Home Assistant keeps one pooled session per SSL mode, so connections to
+        # the controller are reused across polls and across clients.
+        self._session = async_get_clientsession(self._hass, verify_ssl=self._verify_ssl)
         return self._session
 
-    async def async_login(self, *, force: bool = False) -> None:
-        """Authenticate and store the auth key."""
+    @asynccontextmanager
+    async def _http_errors(
+        self,
+        *,
+        response_error: type[CrestronHomeApiError] = CrestronHomeApiError,
+    ) -> AsyncIterator[None]:
+        """Translate aiohttp failures into API client exceptions."""
+
+        try:
+            yield
+        except CrestronHomeApiError:
+            raise
+        except ClientResponseError as err:
+            raise response_error("Unexpected response from controller") from err
+        except (ClientError, TimeoutError) as err:
+            raise CannotConnectError("Error communicating with controller") from err
+        except ValueError as err:
+            raise CrestronHomeApiError("Controller response was not JSON") from err
+
+    async def async_login(self, *, expired_key: str | None = None) -> None:
+        """Authenticate and store the auth key.
+
+        Passing the ``expired_key`` a request was rejected with forces a new
+        login unless another caller has already replaced that key, so
+        concurrent requests hitting the same expiry share one ``/login``.
+        """
+
+        if self._auth_key and self._auth_key != expired_key:
+            return
 
         async with self._login_lock:
-            if self._auth_key and not force:
+            if self._auth_key and self._auth_key != expired_key:
                 return
 
             session = self._ensure_session()
             url = self._build_url(PATH_LOGIN)
-            headers = {
-                HEADER_ACCEPT: MIME_TYPE_JSON,
-                HEADER_AUTH_TOKEN: self._api_token,
-            }
 
             _LOGGER.debug("Requesting auth key from %s", url)
-            try:
-                async with session.get(url, headers=headers, timeout=self._timeout) as response:
+            async with self._http_errors(response_error=CannotConnectError):
+                async with session.get(
+                    url, headers=self._login_headers, timeout=_DEFAULT_TIMEOUT
+                ) as response:
                     if response.status in (HTTP_UNAUTHORIZED, HTTP_NETWORK_AUTH_REQUIRED):
                         raise InvalidAuthError("Invalid API token provided")
                     response.raise_for_status()
-                    data = await response.json()
-            except InvalidAuthError:
-                raise
-            except ClientResponseError as err:
-                raise CannotConnectError("Unexpected response from controller") from err
-            except (ClientError, asyncio.TimeoutError) as err:
-                raise CannotConnectError("Error communicating with controller") from err
-            except (ContentTypeError, ValueError) as err:
-                raise CrestronHomeApiError("Controller response was not JSON") from err
+                    data = orjson.loads(await response.read())
 
             auth_key = data.get("authkey")
             if not auth_key:
                 raise CrestronHomeApiError("Controller response did not include an auth key")
 
-            self._auth_key = auth_key
-            self._last_used = time.monotonic()
+            self._set_auth_key(auth_key)
             _LOGGER.debug("Successfully obtained auth key")
 
-    async def async_request(self, method: str, path: str, *, retry: bool = True) -> Any:
+    async def async_request(self, method: str, path: str) -> Any:
         """Make an authenticated request to the REST API."""
 
-        await self.async_login()
-
         session = self._ensure_session()
         url = self._build_url(path)
-        headers = {
-            HEADER_ACCEPT: MIME_TYPE_JSON,
-            HEADER_AUTH_KEY: self._auth_key or "",
-        }
+        await self.async_login()
 
-        _LOGGER.debug("Requesting %s %s", method, url)
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        for attempt in range(2):
+            if debug:
+                _LOGGER.debug("Requesting %s %s", method, url)
+
+            auth_key = self._auth_key
+            async with self._http_errors():
+                async with session.request(
+                    method,
+                    url,
+                    headers=self._auth_headers,
+                    timeout=_DEFAULT_TIMEOUT,
+                ) as response:
+                    if response.status in (HTTP_UNAUTHORIZED, HTTP_NETWORK_AUTH_REQUIRED):
+                        if not attempt:
+                            _LOGGER.debug(
+                                "Auth key expired, retrying request after "
+                                "reauthentication"
+                            )
+                            await self.async_login(expired_key=auth_key)
+                        continue
 
-        try:
-            async with session.request(
-                method,
-                url,
-                headers=headers,
-                timeout=self._timeout,
-            ) as response:
-                if response.status in (HTTP_UNAUTHORIZED, HTTP_NETWORK_AUTH_REQUIRED):
-                    if retry:
-                        _LOGGER.debug("Auth key expired, retrying request after reauthentication")
-                        await self.async_login(force=True)
-                        return await self.async_request(method, path, retry=False)
-                    raise InvalidAuthError("Authentication failed after retry")
-
-                response.raise_for_status()
-
-                if response.content_type == MIME_TYPE_JSON:
-                    data = await response.json()
-                else:
-                    data = await response.text()
-        except InvalidAuthError:
-            raise
-        except ClientResponseError as err:
-            raise CrestronHomeApiError("Unexpected response from controller") from err
-        except (ClientError, asyncio.TimeoutError) as err:
-            raise CannotConnectError("Error communicating with controller") from err
-        except (ContentTypeError, ValueError) as err:
-            raise CrestronHomeApiError("Controller response was not JSON") from err
+                    response.raise_for_status()
+
+                    if response.content_type == MIME_TYPE_JSON:
+                        data = orjson.loads(await response.read())
+                    else:
+                        data = await response.text()
+            break
+        else:
+            raise InvalidAuthError("Authentication failed after retry")
 
-        self._last_used = time.monotonic()
         return data
 
-    async def async_get_rooms(self) -> list[Any]:
-        """Return the list of rooms from the controller."""
+    def _unwrap_list(
+        self, path: str, data: Any, keys: tuple[str, ...], label: str
+    ) -> list[Any]:
+        """Return the list payload, remembering which wrapper key held it."""
 
-        data = await self.async_request("GET", PATH_ROOMS)
+        wrapper_key = self._list_keys.get(path)
+        if wrapper_key is None:
+            if type(data) is list:
+                return data
+        elif type(data) is dict:
+            value = data.get(wrapper_key)
+            if type(value) is list:
+                return value
 
         if isinstance(data, list):
+            self._list_keys.pop(path, None)
             return data
         if isinstance(data, dict):
-            # Some controllers may wrap the rooms list in an object.
-            for key in ("rooms", "Rooms"):
-                rooms = data.get(key)
-                if isinstance(rooms, list):
-                    return rooms
+            # Some controllers may wrap the list in an object.
+            for key in keys:
+                value = data.get(key)
+                if isinstance(value, list):
+                    self._list_keys[path] = key
+                    return value
 
-        raise CrestronHomeApiError("Rooms response was not a list")
+        raise CrestronHomeApiError(f"{label} response was not a list")
+
+    async def async_get_rooms(self) -> list[Any]:
+        """Return the list of rooms from the controller."""
+
+        data = await self.async_request("GET", PATH_ROOMS)
+        return self._unwrap_list(PATH_ROOMS, data, ("rooms", "Rooms"), "Rooms")
 
     async def async_get_shades(self) -> list[Any]:
         """Return the list of shades from the controller."""
 
         data = await self.async_request("GET", PATH_SHADES)
-
-        if isinstance(data, list):
-            return data
-        if isinstance(data, dict):
-            for key in ("shades", "Shades"):
-                shades = data.get(key)
-                if isinstance(shades, list):
-                    return shades
-
-        raise CrestronHomeApiError("Shades response was not a list")
+        return self._unwrap_list(PATH_SHADES, data, ("shades", "Shades"), "Shades")
 
     async def async_get_shade(self, shade_id: str | int) -> dict[str, Any]:
         """Return details for a specific shade."""
@@ -230,140 +353,77 @@ class ApiClient:
         raise CrestronHomeApiError("Shade response was not an object")
 
     async def async_set_shade_positions(
-        self, items: list[dict[str, int]], *, retry: bool = True
+        self, items: list[dict[str, int]]
     ) -> ShadeCommandResponse:
         """Send a batch of shade position updates to the controller."""
 
         if not items:
             return ShadeCommandResponse(status="success", results={})
 
-        await self.async_login()
-
         session = self._ensure_session()
         url = self._build_url(PATH_SHADES_SET_STATE)
-        headers = {
-            HEADER_ACCEPT: MIME_TYPE_JSON,
-            HEADER_AUTH_KEY: self._auth_key or "",
-            "Content-Type": MIME_TYPE_JSON,
-        }
+        await self.async_login()
 
         payload = {"shades": items}
+        body = orjson.dumps(payload)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("POST %s payload=%s", PATH_SHADES_SET_STATE, payload)
+
+        for attempt in range(2):
+            auth_key = self._auth_key
+            async with self._http_errors():
+                async with session.post(
+                    url,
+                    headers=self._auth_post_headers,
+                    data=body,
+                    timeout=_DEFAULT_TIMEOUT,
+                ) as response:
+                    if response.status in (HTTP_UNAUTHORIZED, HTTP_NETWORK_AUTH_REQUIRED):
+                        if not attempt:
+                            _LOGGER.debug(
+                                "Auth key expired during SetState, retrying after "
+                                "reauthentication"
+                            )
+                            await self.async_login(expired_key=auth_key)
+                        continue
 
-        _LOGGER.debug("POST %s payload=%s", PATH_SHADES_SET_STATE, payload)
+                    response.raise_for_status()
 
-        try:
-            async with session.post(
-                url,
-                headers=headers,
-                json=payload,
-                timeout=self._timeout,
-            ) as response:
-                if response.status in (HTTP_UNAUTHORIZED, HTTP_NETWORK_AUTH_REQUIRED):
-                    if retry:
-                        _LOGGER.debug(
-                            "Auth key expired during SetState, retrying after reauthentication"
-                        )
-                        await self.async_login(force=True)
-                        return await self.async_set_shade_positions(items, retry=False)
-                    raise InvalidAuthError("Authentication failed after retry")
-
-                response.raise_for_status()
-
-                try:
-                    data = await response.json()
-                except ContentTypeError as err:
-                    raise CrestronHomeApiError(
-                        "Controller response was not JSON"
-                    ) from err
-        except InvalidAuthError:
-            raise
-        except ClientResponseError as err:
-            raise CrestronHomeApiError("Unexpected response from controller") from err
-        except (ClientError, asyncio.TimeoutError) as err:
-            raise CannotConnectError("Error communicating with controller") from err
+                    data = orjson.loads(await response.read())
+            break
+        else:
+            raise InvalidAuthError("Authentication failed after retry")
 
         parsed = self._parse_set_state_response(data)
         if parsed.status == "failure":
             raise ShadeCommandFailedError("Controller rejected the shade command")
 
-        self._last_used = time.monotonic()
         return parsed
 
     def _parse_set_state_response(self, data: Any) -> ShadeCommandResponse:
         if not isinstance(data, dict):
             raise CrestronHomeApiError("SetState response was not an object")
 
-        status_raw = data.get("status")
-        status = self._normalize_status(status_raw)
+        status = _normalize_status(data.get("status"))
         if status is None:
             raise CrestronHomeApiError("SetState response did not include a status")
 
-        results: dict[str, ShadeCommandResult] = {}
+        fallback = "failure" if status == "failure" else "success"
         raw_results = data.get("results") or data.get("items") or data.get("shades")
         if isinstance(raw_results, list):
-            for entry in raw_results:
-                if not isinstance(entry, dict):
-                    continue
-                raw_id = entry.get("id")
-                if raw_id is None:
-                    continue
-                shade_id = str(raw_id)
-                entry_status = self._normalize_status(entry.get("status"))
-                if entry_status is None and "success" in entry:
-                    entry_status = "success" if entry.get("success") else "failure"
-                if entry_status is None and "result" in entry:
-                    entry_status = self._normalize_status(entry.get("result"))
-                message = self._extract_message(entry)
-                results[shade_id] = ShadeCommandResult(
-                    status=entry_status or ("success" if status != "failure" else "failure"),
-                    message=message,
-                )
+            results = _parse_result_list(raw_results, fallback)
         elif isinstance(raw_results, dict):
-            for raw_id, entry in raw_results.items():
-                shade_id = str(raw_id)
-                if isinstance(entry, dict):
-                    entry_status = self._normalize_status(entry.get("status"))
-                    if entry_status is None and "success" in entry:
-                        entry_status = "success" if entry.get("success") else "failure"
-                    message = self._extract_message(entry)
-                else:
-                    entry_status = self._normalize_status(entry)
-                    message = None
-                results[shade_id] = ShadeCommandResult(
-                    status=entry_status or ("success" if status != "failure" else "failure"),
-                    message=message,
-                )
+            results = _parse_result_dict(raw_results, fallback)
+        else:
+            results = {}
 
         return ShadeCommandResponse(status=status, results=results)
 
-    @staticmethod
-    def _normalize_status(value: Any) -> str | None:
-        if value is None:
-            return None
-        if isinstance(value, str):
-            lowered = value.strip().lower()
-            return lowered or None
-        if isinstance(value, bool):
-            return "success" if value else "failure"
-        if isinstance(value, (int, float)):
-            return "success" if value else "failure"
-        return None
-
-    @staticmethod
-    def _extract_message(entry: dict[str, Any]) -> str | None:
-        for key in ("message", "error", "reason", "details"):
-            value = entry.get(key)
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-        return None
-
     async def async_logout(self) -> None:
-        """Close the API session and forget credentials."""
-
-        self._auth_key = None
-        self._last_used = None
+        """Forget credentials; the shared HTTP session stays with Home Assistant."""
 
-        self._session = None
+        self._set_auth_key(None)
 
     async def async_close(self) -> None:
         """Alias for logout for compatibility."""
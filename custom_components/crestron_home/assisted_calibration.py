@@ -1,6 +1,7 @@
 """Helpers for the assisted calibration wizard."""
 from __future__ import annotations
 
+from bisect import insort
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, Sequence
@@ -27,20 +28,12 @@ def _normalized_percent_points(
     """Return sorted percent anchors with epsilon coalescing."""
 
     points: list[int] = []
-    for calibration in calibrations:
-        for percent, _ in calibration.anchors:
-            inserted = False
-            for index, existing in enumerate(points):
-                if abs(existing - percent) <= epsilon:
-                    inserted = True
-                    break
-                if percent < existing:
-                    points.insert(index, percent)
-                    inserted = True
-                    break
-            if not inserted:
-                points.append(percent)
-    points.sort()
+    for percent in sorted(
+        percent for calibration in calibrations for percent, _ in calibration.anchors
+    ):
+        if points and percent - points[-1] <= epsilon:
+            continue
+        points.append(percent)
     return points
 
 
@@ -93,14 +86,9 @@ def apply_assisted_anchor(
             normalized = validate_anchors(anchors)
             return normalized, True
 
-    inserted = False
-    for index, (existing_percent, _) in enumerate(anchors):
-        if percent_value < existing_percent:
-            anchors.insert(index, (percent_value, raw_value))
-            inserted = True
-            break
-    if not inserted:
-        anchors.append((percent_value, raw_value))
+    # No anchor shares this percent (it would have matched above), so plain
+    # tuple ordering places the new anchor by percent.
+    insort(anchors, (percent_value, raw_value))
 
     normalized = validate_anchors(anchors)
     return normalized, True
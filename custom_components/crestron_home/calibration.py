@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from bisect import bisect_left
+from dataclasses import dataclass, field
 import logging
+from operator import itemgetter
 from typing import Any, Iterable, Mapping, MutableMapping, Sequence
 
 __all__ = [
@@ -43,6 +45,9 @@ _LOGGER = logging.getLogger(__name__)
 
 Anchor = tuple[int, int]
 
+_anchor_pc = itemgetter(0)
+_anchor_raw = itemgetter(1)
+
 DEFAULT_ANCHORS: tuple[Anchor, ...] = tuple(
     (int(item["pc"]), int(item["raw"])) for item in CAL_DEFAULT_ANCHORS
 )
@@ -56,12 +61,15 @@ class InvalidCalibrationError(ValueError):
         self.code = code
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ShadeCalibration:
     """Calibration parameters for a single shade."""
 
     anchors: tuple[Anchor, ...] = DEFAULT_ANCHORS
     invert_override: bool | None = None
+    _raw_by_pct: tuple[int, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def resolved_invert(self, global_invert: bool) -> bool:
         """Return the effective invert flag for the shade."""
@@ -70,8 +78,31 @@ class ShadeCalibration:
             return global_invert
         return self.invert_override
 
+    def pct_to_raw(self, pct: int, invert_axis: bool) -> int:
+        """Convert a Home Assistant percentage to a raw position for this shade."""
+
+        table = self._raw_by_pct
+        if table is None:
+            # Percentages are integers in a small fixed range, so the whole curve
+            # fits in a lookup table built on first use.
+            table = tuple(
+                pct_to_raw(value, self.anchors, False)
+                for value in range(CAL_ANCHOR_PC_MIN, CAL_ANCHOR_PC_MAX + 1)
+            )
+            object.__setattr__(self, "_raw_by_pct", table)
+
+        pct_value = max(CAL_ANCHOR_PC_MIN, min(CAL_ANCHOR_PC_MAX, int(pct)))
+        if invert_axis:
+            pct_value = CAL_ANCHOR_PC_MAX - pct_value
+        return table[pct_value - CAL_ANCHOR_PC_MIN]
+
+
+# Shared by every shade without its own calibration, so its lookup table is
+# only built once.
+_DEFAULT_CALIBRATION = ShadeCalibration()
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CalibrationCollection:
     """In-memory cache of calibration data for an entry."""
 
@@ -81,12 +112,30 @@ class CalibrationCollection:
     def for_shade(self, shade_id: str) -> ShadeCalibration:
         """Return calibration data for a shade."""
 
-        if shade_id in self.per_shade:
-            return self.per_shade[shade_id]
-        return ShadeCalibration()
+        return self.per_shade.get(shade_id, _DEFAULT_CALIBRATION)
+
+    def with_global_invert(self, global_invert: bool) -> CalibrationCollection:
+        """Return a copy of the collection with a different global invert flag."""
+
+        return CalibrationCollection(global_invert, self.per_shade)
+
+    def with_shades(
+        self, updates: Mapping[str, ShadeCalibration | None]
+    ) -> CalibrationCollection:
+        """Return a copy with shade calibrations replaced, or removed for ``None``."""
+
+        per_shade = dict(self.per_shade)
+        for shade_id, calibration in updates.items():
+            if calibration is None:
+                per_shade.pop(str(shade_id), None)
+            else:
+                per_shade[str(shade_id)] = calibration
+        return CalibrationCollection(self.global_invert, per_shade)
 
 
 def _coerce_int(value: Any) -> int:
+    if type(value) is int:
+        return value
     if isinstance(value, bool):
         raise TypeError("Boolean values are not valid integers")
     if isinstance(value, int):
@@ -103,7 +152,7 @@ def validate_anchors(raw_anchors: Iterable[Any]) -> tuple[Anchor, ...]:
 
     anchors: list[Anchor] = []
     for index, item in enumerate(raw_anchors):
-        if isinstance(item, Mapping):
+        if type(item) is dict or isinstance(item, Mapping):
             pc_value = item.get("pc")
             raw_value = item.get("raw")
         elif isinstance(item, (tuple, list)) and len(item) >= 2:
@@ -130,6 +179,30 @@ def validate_anchors(raw_anchors: Iterable[Any]) -> tuple[Anchor, ...]:
                 f"Anchor #{index} raw value {raw_value!r} is not a number",
             ) from err
 
+        if not (CAL_ANCHOR_PC_MIN <= pc <= CAL_ANCHOR_PC_MAX):
+            raise InvalidCalibrationError(
+                ERR_ANCHORS_PC_RANGE,
+                f"Anchor #{index} percent {pc} is outside the 0-100 range",
+            )
+        if not (CAL_ANCHOR_RAW_MIN <= raw <= CAL_ANCHOR_RAW_MAX):
+            raise InvalidCalibrationError(
+                ERR_ANCHORS_RAW_RANGE,
+                f"Anchor #{index} raw {raw} is outside the valid range",
+            )
+
+        if anchors:
+            prev_pc, prev_raw = anchors[-1]
+            if pc <= prev_pc:
+                raise InvalidCalibrationError(
+                    ERR_ANCHORS_PC_ORDER,
+                    "Anchor percentages must be strictly increasing",
+                )
+            if raw < prev_raw:
+                raise InvalidCalibrationError(
+                    ERR_ANCHORS_RAW_MONOTONIC,
+                    "Anchor raw values must be monotonically non-decreasing",
+                )
+
         anchors.append((pc, raw))
 
     if len(anchors) < 2:
@@ -144,32 +217,6 @@ def validate_anchors(raw_anchors: Iterable[Any]) -> tuple[Anchor, ...]:
             "First anchor must start at 0% and last anchor must end at 100%",
         )
 
-    for index, (pc, raw) in enumerate(anchors):
-        if not (CAL_ANCHOR_PC_MIN <= pc <= CAL_ANCHOR_PC_MAX):
-            raise InvalidCalibrationError(
-                ERR_ANCHORS_PC_RANGE,
-                f"Anchor #{index} percent {pc} is outside the 0-100 range",
-            )
-        if not (CAL_ANCHOR_RAW_MIN <= raw <= CAL_ANCHOR_RAW_MAX):
-            raise InvalidCalibrationError(
-                ERR_ANCHORS_RAW_RANGE,
-                f"Anchor #{index} raw {raw} is outside the valid range",
-            )
-
-    for index in range(1, len(anchors)):
-        prev_pc, prev_raw = anchors[index - 1]
-        pc, raw = anchors[index]
-        if pc <= prev_pc:
-            raise InvalidCalibrationError(
-                ERR_ANCHORS_PC_ORDER,
-                "Anchor percentages must be strictly increasing",
-            )
-        if raw < prev_raw:
-            raise InvalidCalibrationError(
-                ERR_ANCHORS_RAW_MONOTONIC,
-                "Anchor raw values must be monotonically non-decreasing",
-            )
-
     return tuple(anchors)
 
 
@@ -202,13 +249,13 @@ def parse_calibration_options(options: Mapping[str, Any]) -> CalibrationCollecti
     per_shade: dict[str, ShadeCalibration] = {}
     raw_calibration = options.get(OPT_CALIBRATION, {})
 
-    if not isinstance(raw_calibration, Mapping):
+    if type(raw_calibration) is not dict and not isinstance(raw_calibration, Mapping):
         _LOGGER.warning("Calibration options were not a mapping; ignoring")
         return CalibrationCollection(global_invert, per_shade)
 
     for raw_shade_id, raw_data in raw_calibration.items():
         shade_id = str(raw_shade_id)
-        if not isinstance(raw_data, Mapping):
+        if type(raw_data) is not dict and not isinstance(raw_data, Mapping):
             _LOGGER.warning(
                 "Calibration entry for shade %s is invalid; expected mapping", shade_id
             )
@@ -235,18 +282,15 @@ def pct_to_raw(pct: int, anchors: Sequence[Anchor], invert_axis: bool) -> int:
     elif pct_value >= anchors[-1][0]:
         raw = anchors[-1][1]
     else:
-        raw = anchors[-1][1]
-        for index in range(len(anchors) - 1):
-            pc_start, raw_start = anchors[index]
-            pc_end, raw_end = anchors[index + 1]
-            if pct_value <= pc_end:
-                span = pc_end - pc_start
-                if span <= 0:
-                    raw = raw_end
-                    break
-                ratio = (pct_value - pc_start) / span
-                raw = raw_start + (raw_end - raw_start) * ratio
-                break
+        # Anchors are sorted by percent, so binary search for the segment end.
+        index = 1 if len(anchors) == 2 else bisect_left(anchors, pct_value, 1, key=_anchor_pc)
+        pc_start, raw_start = anchors[index - 1]
+        pc_end, raw_end = anchors[index]
+        span = pc_end - pc_start
+        if span <= 0:
+            raw = raw_end
+        else:
+            raw = raw_start + (raw_end - raw_start) * ((pct_value - pc_start) / span)
 
     raw_int = int(round(raw))
     if raw_int < CAL_ANCHOR_RAW_MIN:
@@ -264,25 +308,21 @@ def raw_to_pct(raw: int | None, anchors: Sequence[Anchor], invert_axis: bool) ->
 
     raw_value = max(CAL_ANCHOR_RAW_MIN, min(CAL_ANCHOR_RAW_MAX, int(raw)))
 
-    pct = anchors[-1][0]
-    for index in range(len(anchors) - 1):
-        pc_start, raw_start = anchors[index]
-        pc_end, raw_end = anchors[index + 1]
-        if raw_value > raw_end:
-            continue
+    # Raw values are non-decreasing, so the first anchor at or above the value
+    # (ignoring the first anchor) ends the segment that contains it.
+    index = bisect_left(anchors, raw_value, 1, key=_anchor_raw)
+    if index >= len(anchors):
+        pct = anchors[-1][0]
+    else:
+        pc_start, raw_start = anchors[index - 1]
+        pc_end, raw_end = anchors[index]
         if raw_end == raw_start:
-            if raw_value < raw_start:
-                pct = pc_start
-            else:
-                pct = pc_end
-            break
-        if raw_value <= raw_start:
+            pct = pc_start if raw_value < raw_start else pc_end
+        elif raw_value <= raw_start:
             pct = pc_start
-            break
-        span = raw_end - raw_start
-        ratio = (raw_value - raw_start) / span
-        pct = pc_start + (pc_end - pc_start) * ratio
-        break
+        else:
+            ratio = (raw_value - raw_start) / (raw_end - raw_start)
+            pct = pc_start + (pc_end - pc_start) * ratio
 
     pct_int = int(round(pct))
     if invert_axis:
@@ -307,13 +347,10 @@ def update_calibration_option(
     anchors_payload = [
         {"pc": anchor[0], "raw": anchor[1]} for anchor in calibration.anchors
     ]
-    payload: dict[str, Any] = {CAL_KEY_ANCHORS: anchors_payload}
-    if calibration.invert_override is not None:
-        payload[CAL_KEY_INVERT] = calibration.invert_override
-    else:
-        payload[CAL_KEY_INVERT] = None
-
-    calibration_root[str(shade_id)] = payload
+    calibration_root[str(shade_id)] = {
+        CAL_KEY_ANCHORS: anchors_payload,
+        CAL_KEY_INVERT: calibration.invert_override,
+    }
 
 
 def remove_calibration_option(options: MutableMapping[str, Any], shade_id: str) -> None:
@@ -322,7 +359,6 @@ def remove_calibration_option(options: MutableMapping[str, Any], shade_id: str)
     calibration_root = options.get(OPT_CALIBRATION)
     if not isinstance(calibration_root, MutableMapping):
         return
-    if str(shade_id) in calibration_root:
-        calibration_root.pop(str(shade_id))
+    calibration_root.pop(str(shade_id), None)
     if not calibration_root:
         options.pop(OPT_CALIBRATION, None)
@@ -2,13 +2,10 @@
 from __future__ import annotations
 
 import asyncio
-import copy
 import logging
 import re
-from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Any, Mapping, Sequence
-from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Mapping, Sequence
 
 import voluptuous as vol
 
@@ -27,7 +24,6 @@ from .calibration import (
     InvalidCalibrationError,
     ShadeCalibration,
     parse_calibration_options,
-    pct_to_raw,
     raw_to_pct,
     remove_calibration_option,
     update_calibration_option,
@@ -41,10 +37,6 @@ from .const import (
     CONFIG_FLOW_TIMEOUT,
     CONF_API_TOKEN,
     CONF_INVERT,
-    DATA_PREDICTIVE_MANAGER,
-    DATA_PREDICTIVE_STORAGE,
-    DATA_SHADES_COORDINATOR,
-    DATA_WRITE_BATCHER,
     DEFAULT_INVERT,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
@@ -69,12 +61,175 @@ from .assisted_calibration import (
 )
 from .write import ShadeWriteBatcher
 
+if TYPE_CHECKING:
+    from . import CrestronHomeRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
 
 VISUAL_GROUP_UNASSIGNED = "__unassigned__"
 
+# Connection test form errors, most specific exception type first.
+_CONNECTION_TEST_ERRORS: tuple[tuple[type[Exception], str], ...] = (
+    (asyncio.TimeoutError, "cannot_connect"),
+    (InvalidAuthError, "invalid_auth"),
+    (CannotConnectError, "cannot_connect"),
+    (CrestronHomeApiError, "unknown"),
+)
+
+_GROUP_ID_INVALID_CHARS = re.compile(r"[^a-z0-9_]+")
+
+# Forms whose schema never changes, or only through a boolean default.
+_VISUAL_GROUP_NAME_SCHEMA = vol.Schema({vol.Required("name", default=""): str})
+_CONFIRM_SCHEMA = vol.Schema({vol.Required("confirm", default=False): bool})
+_SHADE_ID_SCHEMA = vol.Schema({vol.Required("shade"): str})
+_GLOBAL_DEFAULTS_SCHEMAS = {
+    default: vol.Schema({vol.Required(CONF_INVERT, default=default): bool})
+    for default in (False, True)
+}
+_PREDICTIVE_STOP_SCHEMAS = {
+    default: vol.Schema({vol.Required(OPT_PREDICTIVE_STOP, default=default): bool})
+    for default in (False, True)
+}
+
+# The edit_shade form is re-rendered after every anchor change; the parts of its
+# schema that do not depend on the working anchors are built once here.
+_ANCHOR_PC_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=CAL_ANCHOR_PC_MIN, max=CAL_ANCHOR_PC_MAX)
+)
+_ANCHOR_RAW_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=CAL_ANCHOR_RAW_MIN, max=CAL_ANCHOR_RAW_MAX)
+)
+_ASSISTED_SELECT_GROUP_ACTION_SELECTOR = selector.selector(
+    {
+        "select": {
+            "options": [
+                {"value": "start", "label": "Start"},
+                {"value": "undo", "label": "Undo last"},
+                {"value": "back", "label": "Back"},
+            ],
+            "mode": "dropdown",
+        }
+    }
+)
+_ASSISTED_TARGET_MODE_SELECTOR = selector.selector(
+    {
+        "select": {
+            "options": [
+                {"value": "automatic", "label": "Automatic"},
+                {"value": "current", "label": "From current location"},
+            ],
+            "mode": "dropdown",
+        }
+    }
+)
+_ASSISTED_TARGET_ACTION_SELECTOR = selector.selector(
+    {
+        "select": {
+            "options": [
+                {"value": "stage", "label": "Continue"},
+                {"value": "back", "label": "Change group"},
+            ]
+        }
+    }
+)
+_ASSISTED_STAGE_SCHEMA = vol.Schema(
+    {
+        vol.Required("action", default="record"): selector.selector(
+            {
+                "select": {
+                    "options": [
+                        {"value": "record", "label": "Record anchors"},
+                        {"value": "restage", "label": "Stage again"},
+                        {"value": "target", "label": "Pick new target"},
+                        {"value": "cancel", "label": "Back to groups"},
+                    ],
+                    "mode": "dropdown",
+                }
+            }
+        )
+    }
+)
+_ANCHOR_FIELD_KEYS = tuple((f"pc_{index}", f"raw_{index}") for index in range(32))
+_INVERT_TO_FORM: dict[bool | None, str] = {True: "inverted", False: "normal"}
+_INVERT_FROM_FORM: dict[str, bool] = {"inverted": True, "normal": False}
+_INVERT_AXIS_SELECTOR = selector.selector(
+    {
+        "select": {
+            "options": [
+                {"value": "default", "label": "Use global default"},
+                {"value": "normal", "label": "Normal axis"},
+                {"value": "inverted", "label": "Invert axis"},
+            ],
+            "mode": "dropdown",
+        }
+    }
+)
+_EDIT_SHADE_ACTION_SELECTOR = selector.selector(
+    {
+        "select": {
+            "options": [
+                {"value": "save", "label": "Save calibration"},
+                {"value": "add", "label": "Add anchor"},
+                {"value": "remove", "label": "Remove anchor"},
+                {"value": "reset", "label": "Reset to defaults"},
+                {"value": "cancel", "label": "Back"},
+            ],
+            "mode": "dropdown",
+        }
+    }
+)
+
+
+def _host_from_input(value: str) -> str:
+    """Return the ``host[:port]`` a user entered, accepting pasted URLs."""
+
+    host = value.strip()
+    if "://" in host:
+        authority = host.split("://", 1)[1]
+        for separator in "/?#":
+            authority = authority.split(separator, 1)[0]
+        # Drop any "user@" prefix; bracketed IPv6 hosts are kept intact.
+        host = authority.rpartition("@")[2].lower()
+    return host.strip("/")
+
+
+def _anchor_field_keys(index: int) -> tuple[str, str]:
+    """Return the edit_shade form keys for the anchor at ``index``."""
+
+    if index < len(_ANCHOR_FIELD_KEYS):
+        return _ANCHOR_FIELD_KEYS[index]
+    return f"pc_{index}", f"raw_{index}"
+
+
+def _selector_value(value: Any) -> Any:
+    """Return the actual payload from Home Assistant selector values."""
+
+    value_type = type(value)
+    if value_type is str:
+        return value
+    if value_type is dict or isinstance(value, Mapping):
+        if "value" in value:
+            return value["value"]
+        if "id" in value:
+            return value["id"]
+
+    candidate = getattr(value, "value", None)
+    if candidate is not None:
+        return candidate
+
+    return value
+
+
+def _clone_options(value: Any) -> Any:
+    """Copy the JSON-style containers of an options tree."""
+
+    if isinstance(value, Mapping):
+        return {key: _clone_options(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_clone_options(item) for item in value]
+    return value
+
 
 class CrestronHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Crestron Home."""
@@ -93,16 +248,7 @@ class CrestronHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         if user_input is not None:
             submitted = dict(user_input)
-            host = submitted.get(CONF_HOST, "").strip()
-            if "://" in host:
-                parsed = urlparse(host)
-                if parsed.hostname:
-                    host = parsed.hostname
-                    if parsed.port:
-                        host = f"{host}:{parsed.port}"
-                else:
-                    host = host.split("//", 1)[1]
-            host = host.strip("/")
+            host = _host_from_input(submitted.get(CONF_HOST, ""))
             submitted[CONF_HOST] = host
             submitted[CONF_API_TOKEN] = submitted.get(CONF_API_TOKEN, "").strip()
             submitted[CONF_VERIFY_SSL] = bool(
@@ -129,30 +275,27 @@ class CrestronHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             try:
                 async with asyncio.timeout(CONFIG_FLOW_TIMEOUT):
                     rooms = await client.async_get_rooms()
-            except asyncio.TimeoutError as err:
-                log_level = logging.WARNING
-                response_details = err
-                errors["base"] = "cannot_connect"
-            except InvalidAuthError as err:
-                log_level = logging.WARNING
-                response_details = err
-                errors["base"] = "invalid_auth"
-            except CannotConnectError as err:
-                log_level = logging.WARNING
-                response_details = err
-                errors["base"] = "cannot_connect"
-            except CrestronHomeApiError as err:
+            except (asyncio.TimeoutError, CrestronHomeApiError) as err:
                 log_level = logging.WARNING
                 response_details = err
-                errors["base"] = "unknown"
+                errors["base"] = next(
+                    code
+                    for error_type, code in _CONNECTION_TEST_ERRORS
+                    if isinstance(err, error_type)
+                )
             else:
                 response_details = rooms
                 self._rooms_count = len(rooms)
                 self._user_input = submitted
                 return await self.async_step_confirm()
             finally:
-                _LOGGER.log(log_level, "Connection test request: %s", request_details)
-                _LOGGER.log(log_level, "Connection test response: %s", response_details)
+                if _LOGGER.isEnabledFor(log_level):
+                    _LOGGER.log(
+                        log_level, "Connection test request: %s", request_details
+                    )
+                    _LOGGER.log(
+                        log_level, "Connection test response: %s", response_details
+                    )
                 await client.async_logout()
 
         defaults = submitted or user_input or {}
@@ -205,11 +348,10 @@ class CrestronHomeConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Return True if the host already has a config entry."""
 
         normalized_host = host.lower()
-        for entry in self._async_current_entries():
-            existing_host = entry.data.get(CONF_HOST, "").lower()
-            if existing_host == normalized_host:
-                return True
-        return False
+        return any(
+            entry.data.get(CONF_HOST, "").lower() == normalized_host
+            for entry in self._async_current_entries()
+        )
 
     @staticmethod
     @callback
@@ -227,8 +369,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: ConfigEntry) -> None:
         self._config_entry = config_entry
 
-        base_options = dict(config_entry.options)
-        self._options: dict[str, Any] = copy.deepcopy(base_options)
+        self._options: dict[str, Any] = _clone_options(config_entry.options)
         if CONF_INVERT not in self._options:
             self._options[CONF_INVERT] = DEFAULT_INVERT
         if OPT_PREDICTIVE_STOP not in self._options:
@@ -237,76 +378,79 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             self._options
         )
         self._visual_groups: VisualGroupsConfig = parse_visual_groups(self._options)
+        self._visual_groups_revision = 0
+        self._visual_group_choices_cache: tuple[int, dict[str, str]] | None = None
+        self._visual_group_select_schema_cache: tuple[int, vol.Schema] | None = None
+        self._visual_group_assign_selector_cache: tuple[int, Any] | None = None
+        self._members_by_group_cache: tuple[int, dict[str, list[str]]] | None = None
         self._selected_shade_id: str | None = None
-        self._working_anchors: list[dict[str, int]] | None = None
+        self._working_anchors: list[tuple[int, int]] | None = None
         self._working_invert_override: bool | None = None
         self._selected_group_id: str | None = None
         self._assisted_group_id: str | None = None
         self._assisted_members: list[str] = []
+        self._assisted_members_label_cache: tuple[object, str] | None = None
         self._assisted_target_percent: int | None = None
         self._assisted_use_current_position = False
         self._assisted_stage_sent = False
+        self._assisted_staged_signature: tuple[Any, ...] | None = None
         self._assisted_stage_warnings: list[str] = []
         self._assisted_active_members: list[str] = []
         self._assisted_feedback: dict[str, object] | None = None
         self._assisted_snapshot: dict[str, tuple[ShadeCalibration, bool]] | None = None
         self._assisted_last_run: AssistedCalibrationRun | None = None
+        self._shade_choices_cache: tuple[object, dict[str, str]] | None = None
+        self._select_shade_schema_cache: tuple[object, vol.Schema] | None = None
+        self._anchor_nav_selectors_cache: (
+            tuple[tuple[int, ...], Any | None, Any | None] | None
+        ) = None
+
+    @property
+    def _runtime_data(self) -> CrestronHomeRuntimeData | None:
+        return getattr(self._config_entry, "runtime_data", None)
 
     @property
     def _coordinator(self) -> ShadesCoordinator | None:
-        domain_data = self.hass.data.get(DOMAIN)
-        if not domain_data:
+        runtime_data = self._runtime_data
+        if runtime_data is None:
             return None
-        entry_data = domain_data.get(self._config_entry.entry_id)
-        if not entry_data:
-            return None
-        coordinator = entry_data.get(DATA_SHADES_COORDINATOR)
-        if isinstance(coordinator, ShadesCoordinator):
-            return coordinator
-        return None
+        return runtime_data.coordinator
 
     @property
     def _write_batcher(self) -> ShadeWriteBatcher | None:
-        domain_data = self.hass.data.get(DOMAIN)
-        if not domain_data:
-            return None
-        entry_data = domain_data.get(self._config_entry.entry_id)
-        if not entry_data:
+        runtime_data = self._runtime_data
+        if runtime_data is None:
             return None
-        batcher = entry_data.get(DATA_WRITE_BATCHER)
-        if isinstance(batcher, ShadeWriteBatcher):
-            return batcher
-        return None
+        return runtime_data.batcher
 
     @property
     def _predictive_runtime(self) -> PredictiveRuntime | None:
-        domain_data = self.hass.data.get(DOMAIN)
-        if not domain_data:
+        runtime_data = self._runtime_data
+        if runtime_data is None:
             return None
-        entry_data = domain_data.get(self._config_entry.entry_id)
-        if not entry_data:
-            return None
-        runtime = entry_data.get(DATA_PREDICTIVE_MANAGER)
-        if isinstance(runtime, PredictiveRuntime):
-            return runtime
-        return None
+        return runtime_data.predictive
 
     @property
     def _predictive_store(self) -> PredictiveStopStore | None:
-        domain_data = self.hass.data.get(DOMAIN)
-        if not domain_data:
-            return None
-        entry_data = domain_data.get(self._config_entry.entry_id)
-        if not entry_data:
+        runtime_data = self._runtime_data
+        if runtime_data is None:
             return None
-        store = entry_data.get(DATA_PREDICTIVE_STORAGE)
-        if isinstance(store, PredictiveStopStore):
-            return store
-        return None
+        return runtime_data.predictive_store
 
     def _shade_choices(self) -> dict[str, str]:
-        choices: dict[str, str] = {}
         coordinator = self._coordinator
+        source: Mapping[str, Any] = (
+            coordinator.data
+            if coordinator and coordinator.data
+            else self._calibration_collection.per_shade
+        )
+        # Coordinator refreshes and calibration edits replace these mappings, so
+        # their identity tells us when the labels need rebuilding.
+        cached = self._shade_choices_cache
+        if cached is not None and cached[0] is source:
+            return cached[1]
+
+        choices: dict[str, str] = {}
         if coordinator and coordinator.data:
             for shade_id, shade in sorted(coordinator.data.items()):
                 label = shade.name if shade.name else shade_id
@@ -316,35 +460,66 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         else:
             for shade_id in sorted(self._calibration_collection.per_shade.keys()):
                 choices[shade_id] = shade_id
+        self._shade_choices_cache = (source, choices)
         return choices
 
     def _visual_group_choices(self) -> dict[str, str]:
-        return {
+        # Group edits always go through _save_visual_groups, which bumps the
+        # revision and so invalidates the cached choices.
+        cached = self._visual_group_choices_cache
+        if cached is not None and cached[0] == self._visual_groups_revision:
+            return cached[1]
+
+        choices = {
             group_id: entry.name
             for group_id, entry in sorted(self._visual_groups.groups.items())
         }
+        self._visual_group_choices_cache = (self._visual_groups_revision, choices)
+        return choices
 
-    @staticmethod
-    def _selector_value(value: Any) -> Any:
-        """Return the actual payload from Home Assistant selector values."""
+    def _visual_group_select_schema(self) -> vol.Schema:
+        """Return the group picker shared by the rename and delete steps."""
 
-        if isinstance(value, Mapping):
-            if "value" in value:
-                return value["value"]
-            if "id" in value:
-                return value["id"]
+        cached = self._visual_group_select_schema_cache
+        if cached is not None and cached[0] == self._visual_groups_revision:
+            return cached[1]
 
-        candidate = getattr(value, "value", None)
-        if candidate is not None:
-            return candidate
+        options = [
+            {"label": name, "value": group_id}
+            for group_id, name in self._visual_group_choices().items()
+        ]
+        schema = vol.Schema(
+            {vol.Required("group"): selector.selector({"select": {"options": options}})}
+        )
+        self._visual_group_select_schema_cache = (self._visual_groups_revision, schema)
+        return schema
 
-        return value
+    def _visual_group_assign_selector(self) -> Any:
+        """Return the per-shade group selector used by visual_groups_assign."""
+
+        cached = self._visual_group_assign_selector_cache
+        if cached is not None and cached[0] == self._visual_groups_revision:
+            return cached[1]
+
+        group_options = [
+            {"label": name, "value": group_id}
+            for group_id, name in self._visual_group_choices().items()
+        ]
+        group_options.sort(key=lambda item: item["label"].lower())
+        group_options.insert(0, {"label": "Unassigned", "value": VISUAL_GROUP_UNASSIGNED})
+
+        group_selector = selector.selector({"select": {"options": group_options}})
+        self._visual_group_assign_selector_cache = (
+            self._visual_groups_revision,
+            group_selector,
+        )
+        return group_selector
 
     @staticmethod
     def _normalize_shade_id(value: Any) -> str:
         """Extract a shade identifier from selector values."""
 
-        candidate = CrestronHomeOptionsFlowHandler._selector_value(value)
+        candidate = _selector_value(value)
         if candidate is None:
             return ""
 
@@ -352,75 +527,92 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
 
     @staticmethod
     def _normalize_group_id(value: Any) -> str:
-        candidate = CrestronHomeOptionsFlowHandler._selector_value(value)
+        candidate = _selector_value(value)
         if candidate is None:
             return ""
         return str(candidate).strip()
 
     @staticmethod
     def _invert_to_form(value: bool | None) -> str:
-        if value is True:
-            return "inverted"
-        if value is False:
-            return "normal"
-        return "default"
+        return _INVERT_TO_FORM.get(value, "default")
 
     @staticmethod
     def _invert_from_form(value: Any) -> bool | None:
-        normalized = CrestronHomeOptionsFlowHandler._selector_value(value)
+        normalized = _selector_value(value)
         if normalized is None:
             return None
 
-        if isinstance(normalized, str):
-            lowered = normalized.strip().lower()
-        else:
-            lowered = str(normalized).strip().lower()
-
-        if lowered == "inverted":
-            return True
-        if lowered == "normal":
-            return False
-        return None
+        return _INVERT_FROM_FORM.get(str(normalized).strip().lower())
 
     @staticmethod
     def _new_anchor_between(
-        previous_anchor: dict[str, int], next_anchor: dict[str, int]
-    ) -> dict[str, int]:
-        span_pc = next_anchor["pc"] - previous_anchor["pc"]
+        previous_anchor: tuple[int, int], next_anchor: tuple[int, int]
+    ) -> tuple[int, int]:
+        prev_pc, prev_raw = previous_anchor
+        next_pc, next_raw = next_anchor
+        span_pc = next_pc - prev_pc
         if span_pc <= 1:
-            pct = previous_anchor["pc"] + 1
+            pct = prev_pc + 1
         else:
-            pct = previous_anchor["pc"] + span_pc // 2
+            pct = prev_pc + span_pc // 2
         pct = max(CAL_ANCHOR_PC_MIN + 1, min(pct, CAL_ANCHOR_PC_MAX - 1))
-        raw_span = next_anchor["raw"] - previous_anchor["raw"]
+        raw_span = next_raw - prev_raw
         if raw_span == 0:
-            raw_value = previous_anchor["raw"]
+            raw_value = prev_raw
         else:
-            raw_value = previous_anchor["raw"] + round(raw_span / 2)
+            raw_value = prev_raw + round(raw_span / 2)
         raw_value = max(CAL_ANCHOR_RAW_MIN, min(raw_value, CAL_ANCHOR_RAW_MAX))
-        return {"pc": pct, "raw": raw_value}
+        return pct, raw_value
 
     def _load_working_calibration(self, shade_id: str) -> None:
         calibration = self._calibration_collection.for_shade(shade_id)
-        self._working_anchors = [
-            {"pc": anchor[0], "raw": anchor[1]} for anchor in calibration.anchors
-        ]
+        self._working_anchors = list(calibration.anchors)
         self._working_invert_override = calibration.invert_override
 
-    def _anchors_from_input(self, user_input: Mapping[str, Any]) -> list[dict[str, int]]:
+    def _anchor_nav_selectors(self) -> tuple[Any | None, Any | None]:
+        """Return the edit_shade insert/remove selectors for the working anchors."""
+
         assert self._working_anchors is not None
-        anchors: list[dict[str, int]] = []
-        for index in range(len(self._working_anchors)):
-            anchors.append(
-                {
-                    "pc": int(user_input[f"pc_{index}"]),
-                    "raw": int(user_input[f"raw_{index}"]),
-                }
+        # The option labels only depend on the anchor percentages, so the
+        # selectors survive re-renders that change raw values or the invert axis.
+        key = tuple(pc for pc, _ in self._working_anchors)
+        cached = self._anchor_nav_selectors_cache
+        if cached is not None and cached[0] == key:
+            return cached[1], cached[2]
+
+        insert_selector = None
+        if len(key) >= 2:
+            insert_options = [
+                {"value": str(index), "label": f"Between {start}% and {end}%"}
+                for index, (start, end) in enumerate(zip(key, key[1:]))
+            ]
+            insert_selector = selector.selector(
+                {"select": {"options": insert_options, "mode": "dropdown"}}
             )
+
+        remove_selector = None
+        if len(key) > 2:
+            remove_options = [
+                {"value": str(index), "label": f"Anchor at {key[index]}%"}
+                for index in range(1, len(key) - 1)
+            ]
+            remove_selector = selector.selector(
+                {"select": {"options": remove_options, "mode": "dropdown"}}
+            )
+
+        self._anchor_nav_selectors_cache = (key, insert_selector, remove_selector)
+        return insert_selector, remove_selector
+
+    def _anchors_from_input(self, user_input: Mapping[str, Any]) -> list[tuple[int, int]]:
+        assert self._working_anchors is not None
+        anchors: list[tuple[int, int]] = []
+        for index in range(len(self._working_anchors)):
+            pc_key, raw_key = _anchor_field_keys(index)
+            anchors.append((int(user_input[pc_key]), int(user_input[raw_key])))
         return anchors
 
     def _generate_group_id(self, name: str) -> str:
-        base = re.sub(r"[^a-z0-9_]+", "_", name.lower()).strip("_")
+        base = _GROUP_ID_INVALID_CHARS.sub("_", name.lower()).strip("_")
         if not base:
             base = "group"
         candidate = base
@@ -431,6 +623,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         return candidate
 
     def _save_visual_groups(self) -> None:
+        self._visual_groups_revision += 1
         self._visual_groups.version = VISUAL_GROUPS_VERSION
         update_visual_groups_option(self._options, self._visual_groups)
 
@@ -459,18 +652,16 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         if user_input is not None:
-            self._options[CONF_INVERT] = bool(user_input[CONF_INVERT])
-            self._calibration_collection = parse_calibration_options(self._options)
+            global_invert = bool(user_input[CONF_INVERT])
+            self._options[CONF_INVERT] = global_invert
+            self._calibration_collection = (
+                self._calibration_collection.with_global_invert(global_invert)
+            )
             return await self.async_step_init()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    CONF_INVERT,
-                    default=bool(self._options.get(CONF_INVERT, DEFAULT_INVERT)),
-                ): bool,
-            }
-        )
+        data_schema = _GLOBAL_DEFAULTS_SCHEMAS[
+            bool(self._options.get(CONF_INVERT, DEFAULT_INVERT))
+        ]
         return self.async_show_form(
             step_id="global_defaults",
             data_schema=data_schema,
@@ -510,10 +701,9 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 self._save_visual_groups()
                 return await self.async_step_visual_groups()
 
-        data_schema = vol.Schema({vol.Required("name", default=""): str})
         return self.async_show_form(
             step_id="visual_groups_create",
-            data_schema=data_schema,
+            data_schema=_VISUAL_GROUP_NAME_SCHEMA,
             errors=errors,
         )
 
@@ -531,20 +721,9 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_visual_groups_rename()
             errors["group"] = "invalid_group"
 
-        options = [
-            {"label": name, "value": group_id}
-            for group_id, name in self._visual_group_choices().items()
-        ]
-        data_schema = vol.Schema(
-            {
-                vol.Required("group"): selector.selector(
-                    {"select": {"options": options}}
-                )
-            }
-        )
         return self.async_show_form(
             step_id="visual_groups_rename_select",
-            data_schema=data_schema,
+            data_schema=self._visual_group_select_schema(),
             errors=errors,
         )
 
@@ -588,20 +767,9 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 return await self.async_step_visual_groups_delete_confirm()
             errors["group"] = "invalid_group"
 
-        options = [
-            {"label": name, "value": group_id}
-            for group_id, name in self._visual_group_choices().items()
-        ]
-        data_schema = vol.Schema(
-            {
-                vol.Required("group"): selector.selector(
-                    {"select": {"options": options}}
-                )
-            }
-        )
         return self.async_show_form(
             step_id="visual_groups_delete_select",
-            data_schema=data_schema,
+            data_schema=self._visual_group_select_schema(),
             errors=errors,
         )
 
@@ -624,10 +792,9 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             self._selected_group_id = None
             return await self.async_step_visual_groups()
 
-        data_schema = vol.Schema({vol.Required("confirm", default=False): bool})
         return self.async_show_form(
             step_id="visual_groups_delete_confirm",
-            data_schema=data_schema,
+            data_schema=_CONFIRM_SCHEMA,
             description_placeholders={"group": self._visual_groups.groups[group_id].name},
         )
 
@@ -640,22 +807,6 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         if not known_shades:
             return await self.async_step_visual_groups()
 
-        group_options = [
-            {"label": name, "value": group_id}
-            for group_id, name in self._visual_group_choices().items()
-        ]
-        group_options.sort(key=lambda item: item["label"].lower())
-        group_options.insert(0, {"label": "Unassigned", "value": VISUAL_GROUP_UNASSIGNED})
-
-        schema_dict: dict[Any, Any] = {}
-        for shade_id in known_shades:
-            default = self._visual_groups.membership.get(shade_id, VISUAL_GROUP_UNASSIGNED)
-            if default not in self._visual_groups.groups:
-                default = VISUAL_GROUP_UNASSIGNED
-            schema_dict[
-                vol.Required(f"shade::{shade_id}", default=default)
-            ] = selector.selector({"select": {"options": group_options}})
-
         errors: dict[str, str] = {}
         if user_input is not None:
             new_membership: dict[str, str] = {}
@@ -677,6 +828,18 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 self._save_visual_groups()
                 return await self.async_step_visual_groups()
 
+        group_selector = self._visual_group_assign_selector()
+        membership = self._visual_groups.membership
+        groups = self._visual_groups.groups
+        schema_dict: dict[Any, Any] = {}
+        for shade_id in known_shades:
+            default = membership.get(shade_id, VISUAL_GROUP_UNASSIGNED)
+            if default not in groups:
+                default = VISUAL_GROUP_UNASSIGNED
+            schema_dict[
+                vol.Required(f"shade::{shade_id}", default=default)
+            ] = group_selector
+
         data_schema = vol.Schema(schema_dict)
         return self.async_show_form(
             step_id="visual_groups_assign",
@@ -691,18 +854,9 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             self._options[OPT_PREDICTIVE_STOP] = bool(user_input[OPT_PREDICTIVE_STOP])
             return await self.async_step_init()
 
-        data_schema = vol.Schema(
-            {
-                vol.Required(
-                    OPT_PREDICTIVE_STOP,
-                    default=bool(
-                        self._options.get(
-                            OPT_PREDICTIVE_STOP, PREDICTIVE_DEFAULT_ENABLED
-                        )
-                    ),
-                ): bool,
-            }
-        )
+        data_schema = _PREDICTIVE_STOP_SCHEMAS[
+            bool(self._options.get(OPT_PREDICTIVE_STOP, PREDICTIVE_DEFAULT_ENABLED))
+        ]
         return self.async_show_form(
             step_id="predictive_stop",
             data_schema=data_schema,
@@ -744,7 +898,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             )
             data_schema = vol.Schema({vol.Required("shade"): selector_schema})
         else:
-            data_schema = vol.Schema({vol.Required("shade"): str})
+            data_schema = _SHADE_ID_SCHEMA
 
         return self.async_show_form(
             step_id="reset_learning",
@@ -769,7 +923,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             action_raw = user_input.get("action")
-            action = str(self._selector_value(action_raw or "start")).strip().lower()
+            action = str(_selector_value(action_raw or "start")).strip().lower()
             if action == "back":
                 self._assisted_reset()
                 return await self.async_step_init()
@@ -805,7 +959,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             label = f"{entry.name} ({len(members)})"
             group_options.append({"value": group_id, "label": label})
 
-        schema_dict: OrderedDict[Any, Any] = OrderedDict()
+        schema_dict: dict[Any, Any] = {}
         if group_options:
             schema_dict[vol.Required("group")] = selector.selector(
                 {"select": {"options": group_options}}
@@ -813,14 +967,9 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         else:
             status = status or "No visual groups are configured."
 
-        action_options = [
-            {"value": "start", "label": "Start"},
-            {"value": "undo", "label": "Undo last"},
-            {"value": "back", "label": "Back"},
-        ]
-        schema_dict[vol.Required("action", default="start")] = selector.selector(
-            {"select": {"options": action_options, "mode": "dropdown"}}
-        )
+        schema_dict[
+            vol.Required("action", default="start")
+        ] = _ASSISTED_SELECT_GROUP_ACTION_SELECTOR
 
         data_schema = vol.Schema(schema_dict)
 
@@ -851,13 +1000,13 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
 
         if user_input is not None:
             action_raw = user_input.get("action")
-            action = str(self._selector_value(action_raw or "stage")).strip().lower()
+            action = str(_selector_value(action_raw or "stage")).strip().lower()
             if action == "back":
                 self._assisted_reset()
                 return await self.async_step_assisted_calibration_select_group()
 
             mode_raw = user_input.get("mode")
-            mode = str(self._selector_value(mode_raw or "automatic")).strip().lower()
+            mode = str(_selector_value(mode_raw or "automatic")).strip().lower()
             target_raw = user_input.get("target_percent")
             try:
                 target = int(target_raw)
@@ -872,7 +1021,13 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                     CAL_ANCHOR_PC_MIN, min(CAL_ANCHOR_PC_MAX, target)
                 )
                 self._assisted_use_current_position = mode == "current"
-                self._assisted_stage_sent = False
+                # Returning from the stage step with the same inputs would
+                # only re-send the positions the shades were just given.
+                signature = self._assisted_stage_signature(
+                    self._assisted_connected_members()
+                )
+                if signature != self._assisted_staged_signature:
+                    self._assisted_stage_sent = False
                 return await self.async_step_assisted_calibration_stage()
 
         if self._assisted_target_percent is None:
@@ -882,27 +1037,21 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             ]
             self._assisted_target_percent = largest_gap_target(calibrations)
 
-        mode_options = [
-            {"value": "automatic", "label": "Automatic"},
-            {"value": "current", "label": "From current location"},
-        ]
-        schema_dict: OrderedDict[Any, Any] = OrderedDict()
-        schema_dict[vol.Required("mode", default="automatic")] = selector.selector(
-            {"select": {"options": mode_options, "mode": "dropdown"}}
-        )
-        schema_dict[vol.Required(
-            "target_percent", default=self._assisted_target_percent
-        )] = vol.All(
-            vol.Coerce(int),
-            vol.Range(min=CAL_ANCHOR_PC_MIN, max=CAL_ANCHOR_PC_MAX),
-        )
-        schema_dict[vol.Required("action", default="stage")] = selector.selector(
-            {"select": {"options": [{"value": "stage", "label": "Continue"}, {"value": "back", "label": "Change group"}]}}
+        data_schema = vol.Schema(
+            {
+                vol.Required(
+                    "mode", default="automatic"
+                ): _ASSISTED_TARGET_MODE_SELECTOR,
+                vol.Required(
+                    "target_percent", default=self._assisted_target_percent
+                ): _ANCHOR_PC_VALIDATOR,
+                vol.Required(
+                    "action", default="stage"
+                ): _ASSISTED_TARGET_ACTION_SELECTOR,
+            }
         )
 
-        data_schema = vol.Schema(schema_dict)
-
-        members_label = ", ".join(self._assisted_member_labels(self._assisted_members))
+        members_label = self._assisted_members_label()
         group_name = self._visual_groups.group_name(
             self._assisted_group_id, shade_ids=self._assisted_members
         )
@@ -927,17 +1076,23 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         errors: dict[str, str] = {}
 
         if not self._assisted_stage_sent:
+            self._assisted_staged_signature = None
             try:
-                await self._assisted_perform_stage()
+                sent = await self._assisted_perform_stage()
             except HomeAssistantError as err:
                 errors["base"] = "assisted_stage_failed"
                 self._assisted_feedback = {
                     "status": str(err),
                 }
+            else:
+                if sent:
+                    self._assisted_staged_signature = self._assisted_stage_signature(
+                        self._assisted_active_members
+                    )
 
         if user_input is not None:
             action_raw = user_input.get("action")
-            action = str(self._selector_value(action_raw or "record")).strip().lower()
+            action = str(_selector_value(action_raw or "record")).strip().lower()
             if action == "target":
                 return await self.async_step_assisted_calibration_target()
             if action == "cancel":
@@ -961,28 +1116,13 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                     self._assisted_stage_sent = False
                     return await self.async_step_assisted_calibration_target()
 
-        members_label = ", ".join(self._assisted_member_labels(self._assisted_members))
+        members_label = self._assisted_members_label()
         warnings = ", ".join(self._assisted_stage_warnings)
         positions = ", ".join(self._assisted_stage_positions())
 
-        action_options = [
-            {"value": "record", "label": "Record anchors"},
-            {"value": "restage", "label": "Stage again"},
-            {"value": "target", "label": "Pick new target"},
-            {"value": "cancel", "label": "Back to groups"},
-        ]
-
-        data_schema = vol.Schema(
-            {
-                vol.Required("action", default="record"): selector.selector(
-                    {"select": {"options": action_options, "mode": "dropdown"}}
-                )
-            }
-        )
-
         return self.async_show_form(
             step_id="assisted_calibration_stage",
-            data_schema=data_schema,
+            data_schema=_ASSISTED_STAGE_SCHEMA,
             errors=errors,
             description_placeholders={
                 "group": self._visual_groups.group_name(
@@ -999,7 +1139,6 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         errors: dict[str, str] = {}
-        choices = self._shade_choices()
 
         if user_input is not None:
             try:
@@ -1018,47 +1157,63 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 if "base" not in errors:
                     errors["base"] = "unknown"
 
-        if choices:
-            options = [
-                {"value": str(shade_id), "label": str(label)}
-                for shade_id, label in choices.items()
-            ]
-            shade_selector = selector.selector(
-                {
-                    "select": {
-                        "options": options,
-                        "mode": "dropdown",
-                        "custom_value": True,
-                    }
-                }
-            )
-            data_schema = vol.Schema({vol.Required("shade"): shade_selector})
-        else:
-            data_schema = vol.Schema({vol.Required("shade"): str})
-
         return self.async_show_form(
             step_id="select_shade",
-            data_schema=data_schema,
+            data_schema=self._select_shade_schema(),
             errors=errors,
         )
 
+    def _select_shade_schema(self) -> vol.Schema:
+        choices = self._shade_choices()
+        if not choices:
+            return _SHADE_ID_SCHEMA
+        # _shade_choices returns the same mapping until its source changes, so
+        # the dropdown only needs rebuilding when that identity changes.
+        cached = self._select_shade_schema_cache
+        if cached is not None and cached[0] is choices:
+            return cached[1]
+
+        options = [
+            {"value": str(shade_id), "label": str(label)}
+            for shade_id, label in choices.items()
+        ]
+        shade_selector = selector.selector(
+            {
+                "select": {
+                    "options": options,
+                    "mode": "dropdown",
+                    "custom_value": True,
+                }
+            }
+        )
+        data_schema = vol.Schema({vol.Required("shade"): shade_selector})
+        self._select_shade_schema_cache = (choices, data_schema)
+        return data_schema
+
     def _assisted_reset(self) -> None:
         self._assisted_group_id = None
         self._assisted_members = []
+        self._assisted_members_label_cache = None
         self._assisted_target_percent = None
         self._assisted_use_current_position = False
         self._assisted_stage_sent = False
+        self._assisted_staged_signature = None
         self._assisted_stage_warnings = []
         self._assisted_active_members = []
 
     def _assisted_group_members(self, group_id: str) -> list[str]:
-        members = [
-            shade_id
-            for shade_id, assigned in self._visual_groups.membership.items()
-            if assigned == group_id
-        ]
-        members.sort()
-        return members
+        cached = self._members_by_group_cache
+        if cached is None or cached[0] != self._visual_groups_revision:
+            members_by_group: dict[str, list[str]] = {}
+            for shade_id, assigned in self._visual_groups.membership.items():
+                members_by_group.setdefault(assigned, []).append(shade_id)
+            for members in members_by_group.values():
+                members.sort()
+            cached = self._members_by_group_cache = (
+                self._visual_groups_revision,
+                members_by_group,
+            )
+        return list(cached[1].get(group_id, ()))
 
     def _assisted_prepare_group(self, group_id: str) -> bool:
         members = self._assisted_group_members(group_id)
@@ -1066,6 +1221,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             return False
         self._assisted_group_id = group_id
         self._assisted_members = members
+        self._assisted_members_label_cache = None
         calibrations = [
             self._calibration_collection.for_shade(shade_id)
             for shade_id in members
@@ -1077,20 +1233,41 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         self._assisted_active_members = []
         return True
 
-    def _assisted_member_labels(self, members: Sequence[str]) -> list[str]:
-        labels: list[str] = []
+    def _assisted_stage_signature(self, active: Sequence[str]) -> tuple[Any, ...]:
+        return (
+            self._assisted_group_id,
+            self._assisted_target_percent,
+            self._assisted_use_current_position,
+            tuple(active),
+        )
+
+    def _assisted_connected_members(self) -> list[str]:
         coordinator = self._coordinator
-        data = coordinator.data if coordinator and coordinator.data else {}
-        for shade_id in members:
-            label = shade_id
-            shade = data.get(shade_id) if isinstance(data, Mapping) else None
-            if isinstance(shade, Shade) and shade.name:
-                if shade.name == shade_id:
-                    label = shade.name
-                else:
-                    label = f"{shade.name} ({shade_id})"
-            labels.append(label)
-        return labels
+        if coordinator is None or not (data := coordinator.data):
+            return []
+        return [
+            shade_id
+            for shade_id in self._assisted_members
+            if isinstance(shade := data.get(shade_id), Shade) and shade.is_connected
+        ]
+
+    def _assisted_member_labels(self, members: Sequence[str]) -> list[str]:
+        # Shade pickers use the same "Name (id)" labels, already memoized per
+        # coordinator refresh.
+        labels = self._shade_choices()
+        return [labels.get(shade_id, shade_id) for shade_id in members]
+
+    def _assisted_members_label(self) -> str:
+        # The target and stage forms re-render often; only re-join the labels
+        # when the group or the shade label mapping changes.
+        labels = self._shade_choices()
+        cached = self._assisted_members_label_cache
+        if cached is None or cached[0] is not labels:
+            members_label = ", ".join(
+                labels.get(shade_id, shade_id) for shade_id in self._assisted_members
+            )
+            cached = self._assisted_members_label_cache = (labels, members_label)
+        return cached[1]
 
     def _assisted_status_text(
         self, prefix: str, *, saved: Sequence[str], skipped: Sequence[str]
@@ -1106,25 +1283,26 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
             )
         return "; ".join(parts)
 
-    async def _assisted_perform_stage(self) -> None:
+    async def _assisted_perform_stage(self) -> bool:
         coordinator = self._coordinator
         self._assisted_stage_warnings = []
         self._assisted_active_members = []
         if coordinator is None:
             self._assisted_stage_warnings.append("Controller unavailable")
             self._assisted_stage_sent = True
-            return
+            return False
 
         data = coordinator.data or {}
+        labels = self._shade_choices()
         available: list[str] = []
         for shade_id in self._assisted_members:
             shade = data.get(shade_id)
             if not isinstance(shade, Shade):
-                label = self._assisted_member_labels([shade_id])[0]
+                label = labels.get(shade_id, shade_id)
                 self._assisted_stage_warnings.append(f"{label}: unavailable")
                 continue
             if not shade.is_connected:
-                label = self._assisted_member_labels([shade_id])[0]
+                label = labels.get(shade_id, shade_id)
                 self._assisted_stage_warnings.append(f"{label}: offline")
                 continue
             available.append(shade_id)
@@ -1133,42 +1311,46 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         self._assisted_stage_sent = True
 
         if self._assisted_use_current_position or not available:
-            return
+            return False
 
         batcher = self._write_batcher
         if batcher is None:
             self._assisted_stage_warnings.append("Shade control unavailable")
-            return
+            return False
 
         target = self._assisted_target_percent or 0
-        tasks = []
+        calibrations = self._calibration_collection
+        global_invert = calibrations.global_invert
+        commands: list[tuple[str, int]] = []
         for shade_id in available:
-            calibration = self._calibration_collection.for_shade(shade_id)
-            invert = calibration.resolved_invert(self._calibration_collection.global_invert)
-            raw = pct_to_raw(target, calibration.anchors, invert)
-            tasks.append(batcher.enqueue(shade_id, raw))
+            calibration = calibrations.for_shade(shade_id)
+            invert = calibration.resolved_invert(global_invert)
+            commands.append((shade_id, calibration.pct_to_raw(target, invert)))
 
-        if tasks:
-            await asyncio.gather(*tasks)
-            coordinator.burst()
+        await batcher.enqueue_many(commands)
+        coordinator.burst()
+        return True
 
     def _assisted_stage_positions(self) -> list[str]:
         coordinator = self._coordinator
-        if coordinator is None or not coordinator.data:
+        if coordinator is None or not (data := coordinator.data):
             return []
+        labels = self._shade_choices()
+        calibrations = self._calibration_collection
+        global_invert = calibrations.global_invert
         positions: list[str] = []
         for shade_id in self._assisted_members:
-            shade = coordinator.data.get(shade_id)
-            if not isinstance(shade, Shade) or shade.position is None:
+            shade = data.get(shade_id)
+            if not isinstance(shade, Shade) or (position := shade.position) is None:
                 continue
-            calibration = self._calibration_collection.for_shade(shade_id)
-            invert = calibration.resolved_invert(self._calibration_collection.global_invert)
-            pct = raw_to_pct(shade.position, calibration.anchors, invert)
-            label = self._assisted_member_labels([shade_id])[0]
+            calibration = calibrations.for_shade(shade_id)
+            invert = calibration.resolved_invert(global_invert)
+            pct = raw_to_pct(position, calibration.anchors, invert)
+            label = labels.get(shade_id, shade_id)
             if pct is None:
-                positions.append(f"{label}: {shade.position}")
+                positions.append(f"{label}: {position}")
             else:
-                positions.append(f"{label}: {pct}% ({shade.position})")
+                positions.append(f"{label}: {pct}% ({position})")
         return positions
 
     async def _assisted_record(self) -> tuple[list[str], list[str]]:
@@ -1183,25 +1365,21 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         skipped: list[str] = []
         snapshot: dict[str, tuple[ShadeCalibration, bool]] = {}
         new_values: dict[str, ShadeCalibration] = {}
+        data = coordinator.data
+        calibrations = self._calibration_collection
+        per_shade = calibrations.per_shade
 
         for shade_id in self._assisted_members:
-            shade = coordinator.data.get(shade_id)
-            if not isinstance(shade, Shade) or shade.position is None:
+            shade = data.get(shade_id)
+            if not isinstance(shade, Shade) or (position := shade.position) is None:
                 skipped.append(shade_id)
                 continue
-            calibration = self._calibration_collection.for_shade(shade_id)
-            anchors, changed = apply_assisted_anchor(
-                calibration,
-                target,
-                shade.position,
-            )
+            calibration = calibrations.for_shade(shade_id)
+            anchors, changed = apply_assisted_anchor(calibration, target, position)
             if not changed:
                 skipped.append(shade_id)
                 continue
-            snapshot[shade_id] = (
-                calibration,
-                shade_id in self._calibration_collection.per_shade,
-            )
+            snapshot[shade_id] = (calibration, shade_id in per_shade)
             new_values[shade_id] = ShadeCalibration(
                 anchors=anchors,
                 invert_override=calibration.invert_override,
@@ -1221,7 +1399,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         )
 
         if saved:
-            self._calibration_collection = parse_calibration_options(self._options)
+            self._calibration_collection = calibrations.with_shades(new_values)
             self._assisted_snapshot = snapshot
         else:
             self._assisted_snapshot = None
@@ -1244,12 +1422,17 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
         snapshot = self._assisted_snapshot
         if not snapshot:
             return
+        restored: dict[str, ShadeCalibration | None] = {}
         for shade_id, (calibration, had_entry) in snapshot.items():
             if not had_entry and calibration == ShadeCalibration():
                 remove_calibration_option(self._options, shade_id)
+                restored[shade_id] = None
                 continue
             update_calibration_option(self._options, shade_id, calibration)
-        self._calibration_collection = parse_calibration_options(self._options)
+            restored[shade_id] = calibration
+        self._calibration_collection = self._calibration_collection.with_shades(
+            restored
+        )
         self._assisted_snapshot = None
 
     async def async_step_edit_shade(
@@ -1272,7 +1455,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 if action_raw is None:
                     action = "save"
                 else:
-                    action = str(self._selector_value(action_raw)).strip().lower()
+                    action = str(_selector_value(action_raw)).strip().lower()
                     if not action:
                         action = "save"
 
@@ -1281,7 +1464,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                     if insert_after_raw is None:
                         insert_index = len(anchors) - 2
                     else:
-                        insert_after_value = self._selector_value(insert_after_raw)
+                        insert_after_value = _selector_value(insert_after_raw)
                         try:
                             insert_index = int(insert_after_value)
                         except (TypeError, ValueError):
@@ -1299,7 +1482,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                     if remove_index_raw is None:
                         remove_idx = 1
                     else:
-                        remove_index_value = self._selector_value(remove_index_raw)
+                        remove_index_value = _selector_value(remove_index_raw)
                         try:
                             remove_idx = int(remove_index_value)
                         except (TypeError, ValueError):
@@ -1312,9 +1495,7 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                         return await self.async_step_edit_shade()
 
                 if action == "reset":
-                    self._working_anchors = [
-                        {"pc": pc, "raw": raw} for pc, raw in DEFAULT_ANCHORS
-                    ]
+                    self._working_anchors = list(DEFAULT_ANCHORS)
                     self._working_invert_override = None
                     return await self.async_step_edit_shade()
 
@@ -1341,12 +1522,16 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                             remove_calibration_option(
                                 self._options, self._selected_shade_id
                             )
+                            saved_calibration: ShadeCalibration | None = None
                         else:
                             update_calibration_option(
                                 self._options, self._selected_shade_id, calibration
                             )
-                        self._calibration_collection = parse_calibration_options(
-                            self._options
+                            saved_calibration = calibration
+                        self._calibration_collection = (
+                            self._calibration_collection.with_shades(
+                                {self._selected_shade_id: saved_calibration}
+                            )
                         )
                         self._selected_shade_id = None
                         self._working_anchors = None
@@ -1363,87 +1548,28 @@ class CrestronHomeOptionsFlowHandler(config_entries.OptionsFlow):
                 if "base" not in errors:
                     errors["base"] = "unknown"
 
-        schema_dict: OrderedDict[Any, Any] = OrderedDict()
+        schema_dict: dict[Any, Any] = {}
         assert self._working_anchors is not None
-        for index, anchor in enumerate(self._working_anchors):
-            schema_dict[vol.Required(
-                f"pc_{index}", default=anchor["pc"]
-            )] = vol.All(
-                vol.Coerce(int),
-                vol.Range(min=CAL_ANCHOR_PC_MIN, max=CAL_ANCHOR_PC_MAX),
-            )
-            schema_dict[vol.Required(
-                f"raw_{index}", default=anchor["raw"]
-            )] = vol.All(
-                vol.Coerce(int),
-                vol.Range(min=CAL_ANCHOR_RAW_MIN, max=CAL_ANCHOR_RAW_MAX),
-            )
+        for index, (pc, raw) in enumerate(self._working_anchors):
+            pc_key, raw_key = _anchor_field_keys(index)
+            schema_dict[vol.Required(pc_key, default=pc)] = _ANCHOR_PC_VALIDATOR
+            schema_dict[vol.Required(raw_key, default=raw)] = _ANCHOR_RAW_VALIDATOR
 
-        invert_selector = selector.selector(
-            {
-                "select": {
-                    "options": [
-                        {"value": "default", "label": "Use global default"},
-                        {"value": "normal", "label": "Normal axis"},
-                        {"value": "inverted", "label": "Invert axis"},
-                    ],
-                    "mode": "dropdown",
-                }
-            }
-        )
         schema_dict[vol.Required(
             "invert_axis",
             default=self._invert_to_form(self._working_invert_override),
-        )] = invert_selector
+        )] = _INVERT_AXIS_SELECTOR
+        schema_dict[
+            vol.Required("action", default="save")
+        ] = _EDIT_SHADE_ACTION_SELECTOR
 
-        action_selector = selector.selector(
-            {
-                "select": {
-                    "options": [
-                        {"value": "save", "label": "Save calibration"},
-                        {"value": "add", "label": "Add anchor"},
-                        {"value": "remove", "label": "Remove anchor"},
-                        {"value": "reset", "label": "Reset to defaults"},
-                        {"value": "cancel", "label": "Back"},
-                    ],
-                    "mode": "dropdown",
-                }
-            }
-        )
-        schema_dict[vol.Required("action", default="save")] = action_selector
-
-        if len(self._working_anchors) >= 2:
-            insert_options = []
-            for index in range(len(self._working_anchors) - 1):
-                current = self._working_anchors[index]
-                nxt = self._working_anchors[index + 1]
-                label = f"Between {current['pc']}% and {nxt['pc']}%"
-                insert_options.append({"value": str(index), "label": label})
+        insert_selector, remove_selector = self._anchor_nav_selectors()
+        if insert_selector is not None:
             schema_dict[vol.Optional(
                 "insert_after", default=str(len(self._working_anchors) - 2)
-            )] = selector.selector(
-                {
-                    "select": {
-                        "options": insert_options,
-                        "mode": "dropdown",
-                    }
-                }
-            )
-
-        if len(self._working_anchors) > 2:
-            remove_options = []
-            for index in range(1, len(self._working_anchors) - 1):
-                anchor = self._working_anchors[index]
-                label = f"Anchor at {anchor['pc']}%"
-                remove_options.append({"value": str(index), "label": label})
-            schema_dict[vol.Optional("remove_index", default="1")] = selector.selector(
-                {
-                    "select": {
-                        "options": remove_options,
-                        "mode": "dropdown",
-                    }
-                }
-            )
+            )] = insert_selector
+        if remove_selector is not None:
+            schema_dict[vol.Optional("remove_index", default="1")] = remove_selector
 
         data_schema = vol.Schema(schema_dict)
         description_placeholders = {"shade_id": self._selected_shade_id}
@@ -40,6 +40,7 @@ CONFIG_FLOW_TIMEOUT = 30
 HEADER_ACCEPT = "Accept"
 HEADER_AUTH_TOKEN = "Crestron-RestAPI-AuthToken"
 HEADER_AUTH_KEY = "Crestron-RestAPI-AuthKey"
+HEADER_CONTENT_TYPE = "Content-Type"
 
 MIME_TYPE_JSON = "application/json"
 
@@ -50,11 +51,6 @@ PATH_SHADES_SET_STATE = "/cws/api/shades/SetState"
 
 LOG_KEY_BATCH = "batch"
 
-DATA_API_CLIENT = "api_client"
-DATA_SHADES_COORDINATOR = "shades_coordinator"
-DATA_WRITE_BATCHER = "write_batcher"
-DATA_CALIBRATIONS = "calibrations"
-
 SHADE_POLL_INTERVAL_IDLE = 12
 SHADE_POLL_INTERVAL_FAST = 1.5
 SHADE_BOOST_SECONDS = 10
@@ -74,6 +70,3 @@ PREDICTIVE_MIN_CONFIDENCE_SCALE = 0.25
 PREDICTIVE_STORAGE_VERSION = 1
 PREDICTIVE_STORAGE_KEY_PREFIX = "crestron_home_predictive"
 PREDICTIVE_DIAGNOSTIC_HISTORY = 5
-
-DATA_PREDICTIVE_MANAGER = "predictive_manager"
-DATA_PREDICTIVE_STORAGE = "predictive_storage"
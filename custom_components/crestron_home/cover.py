@@ -6,7 +6,7 @@ import asyncio
 import logging
 import time
 
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.cover import (
     ATTR_POSITION,
@@ -22,28 +22,24 @@ from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .calibration import CalibrationCollection, pct_to_raw, raw_to_pct
-from .const import (
-    DATA_CALIBRATIONS,
-    DATA_PREDICTIVE_STORAGE,
-    DATA_WRITE_BATCHER,
-    DATA_SHADES_COORDINATOR,
-    DOMAIN,
-    PREDICTIVE_STORAGE_VERSION,
-)
+from .calibration import raw_to_pct
+from .const import DOMAIN, PREDICTIVE_STORAGE_VERSION
 from .coordinator import Shade, ShadesCoordinator
-from .storage import PredictiveStopStore, PredictiveStoreData
-from .write import ShadeWriteBatcher
+from .storage import PredictiveStoreData
+
+if TYPE_CHECKING:
+    from . import CrestronHomeRuntimeData
 
 _LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(
-    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+    hass: HomeAssistant,
+    entry: ConfigEntry[CrestronHomeRuntimeData],
+    async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Crestron Home cover entities from a config entry."""
 
-    data = hass.data[DOMAIN][entry.entry_id]
-    coordinator: ShadesCoordinator = data[DATA_SHADES_COORDINATOR]
+    coordinator = entry.runtime_data.coordinator
 
     known_ids: set[str] = set()
 
@@ -77,23 +73,20 @@ class CrestronHomeShade(CoordinatorEntity[ShadesCoordinator], CoverEntity):
         | CoverEntityFeature.STOP
     )
 
-    def __init__(self, coordinator: ShadesCoordinator, entry: ConfigEntry, shade_id: str) -> None:
+    def __init__(
+        self,
+        coordinator: ShadesCoordinator,
+        entry: ConfigEntry[CrestronHomeRuntimeData],
+        shade_id: str,
+    ) -> None:
         super().__init__(coordinator)
         self.config_entry = entry
         self._shade_id = shade_id
         self._attr_unique_id = self.compute_unique_id(entry, shade_id)
-        self._write_batcher = cast(
-            ShadeWriteBatcher,
-            coordinator.hass.data[DOMAIN][entry.entry_id][DATA_WRITE_BATCHER],
-        )
-        self._predictive_store = cast(
-            PredictiveStopStore,
-            coordinator.hass.data[DOMAIN][entry.entry_id][DATA_PREDICTIVE_STORAGE],
-        )
-        calibration_collection = cast(
-            CalibrationCollection,
-            coordinator.hass.data[DOMAIN][entry.entry_id][DATA_CALIBRATIONS],
-        )
+        runtime_data = entry.runtime_data
+        self._write_batcher = runtime_data.batcher
+        self._predictive_store = runtime_data.predictive_store
+        calibration_collection = runtime_data.calibrations
         self._calibration_collection = calibration_collection
         self._shade_calibration = calibration_collection.for_shade(shade_id)
         self._invert_axis = self._shade_calibration.resolved_invert(
@@ -228,7 +221,7 @@ class CrestronHomeShade(CoordinatorEntity[ShadesCoordinator], CoverEntity):
                     cal = calibrations.for_shade(target.shade_id)
                     invert = cal.resolved_invert(calibrations.global_invert)
                     pct = int(round(max(0.0, min(1.0, target.position)) * 100))
-                    raw = pct_to_raw(pct, cal.anchors, invert)
+                    raw = cal.pct_to_raw(pct, invert)
                     commands.append((target.shade_id, raw))
                 if not commands:
                     continue
@@ -265,7 +258,7 @@ class CrestronHomeShade(CoordinatorEntity[ShadesCoordinator], CoverEntity):
         ).result()
 
     async def _async_enqueue_position(self, percentage: int) -> None:
-        raw = pct_to_raw(percentage, self._shade_calibration.anchors, self._invert_axis)
+        raw = self._shade_calibration.pct_to_raw(percentage, self._invert_axis)
         predictive = self.coordinator.predictive
         predictive.record_command(self._shade_id, time.monotonic())
         await self._write_batcher.enqueue(self._shade_id, raw)
@@ -288,4 +281,4 @@ class CrestronHomeShade(CoordinatorEntity[ShadesCoordinator], CoverEntity):
         if percent is None:
             return None
 
-        return pct_to_raw(percent, self._shade_calibration.anchors, self._invert_axis)
+        return self._shade_calibration.pct_to_raw(percent, self._invert_axis)
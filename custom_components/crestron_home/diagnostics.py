@@ -2,32 +2,34 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import (
-    DATA_CALIBRATIONS,
-    DATA_PREDICTIVE_MANAGER,
-    DATA_PREDICTIVE_STORAGE,
-    DATA_SHADES_COORDINATOR,
-    DOMAIN,
-)
 from .coordinator import ShadesCoordinator
 from .visual_groups import VisualGroupsConfig
 from .predictive_stop import PredictiveRuntime
 from .storage import PredictiveStopStore
 
+if TYPE_CHECKING:
+    from . import CrestronHomeRuntimeData
+
 
 async def async_get_config_entry_diagnostics(
-    hass: HomeAssistant, entry: ConfigEntry
+    hass: HomeAssistant, entry: ConfigEntry[CrestronHomeRuntimeData]
 ) -> dict[str, object]:
-    domain_data = hass.data.get(DOMAIN, {})
-    entry_data = domain_data.get(entry.entry_id, {})
+    runtime_data: CrestronHomeRuntimeData | None = getattr(entry, "runtime_data", None)
 
-    coordinator: ShadesCoordinator | None = entry_data.get(DATA_SHADES_COORDINATOR)
-    predictive: PredictiveRuntime | None = entry_data.get(DATA_PREDICTIVE_MANAGER)
-    store: PredictiveStopStore | None = entry_data.get(DATA_PREDICTIVE_STORAGE)
-    calibrations = entry_data.get(DATA_CALIBRATIONS)
+    coordinator: ShadesCoordinator | None = None
+    predictive: PredictiveRuntime | None = None
+    store: PredictiveStopStore | None = None
+    calibrations = None
+    if runtime_data is not None:
+        coordinator = runtime_data.coordinator
+        predictive = runtime_data.predictive
+        store = runtime_data.predictive_store
+        calibrations = runtime_data.calibrations
 
     payload: dict[str, object] = {
         "predictive_enabled": predictive.enabled if predictive else None,
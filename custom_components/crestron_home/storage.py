@@ -43,7 +43,9 @@ class PredictiveStopStore:
 
     async def async_clear_shade(self, shade_id: str) -> None:
         data = await self.async_load()
-        if shade_id in data.shades:
-            data.shades.pop(shade_id)
-            await self.async_save(data)
+        try:
+            del data.shades[shade_id]
+        except KeyError:
+            return
+        await self.async_save(data)
 
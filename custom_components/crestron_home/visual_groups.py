@@ -157,8 +157,8 @@ def update_visual_groups_option(
     payload = config.as_options()
     if payload:
         options[OPT_VISUAL_GROUPS] = payload
-    elif OPT_VISUAL_GROUPS in options:
-        options.pop(OPT_VISUAL_GROUPS)
+    else:
+        options.pop(OPT_VISUAL_GROUPS, None)
 
 
 def log_invalid_groups(invalid: Iterable[str]) -> None:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import logging
 from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import dataclass
 from typing import Any, Sequence
 
@@ -60,12 +60,24 @@ class ShadeWriteBatcher:
     async def enqueue(self, shade_id: str, position: int) -> None:
         """Enqueue a shade write request and wait for completion."""
 
+        await self.enqueue_many(((shade_id, position),))
+
+    async def enqueue_many(self, items: Iterable[tuple[str, int]]) -> None:
+        """Enqueue several shade writes and wait until all have completed."""
+
         if self._closed:
             raise HomeAssistantError(self._translate("error_write_disabled"))
 
-        future: asyncio.Future[None] = self._hass.loop.create_future()
-        self._queue[shade_id] = _QueuedItem(shade_id=shade_id, position=position)
-        self._waiters[shade_id].append(future)
+        create_future = self._hass.loop.create_future
+        futures: list[asyncio.Future[None]] = []
+        for shade_id, position in items:
+            future: asyncio.Future[None] = create_future()
+            self._queue[shade_id] = _QueuedItem(shade_id=shade_id, position=position)
+            self._waiters[shade_id].append(future)
+            futures.append(future)
+
+        if not futures:
+            return
 
         if len(self._queue) >= self._max_items:
             self._cancel_timer()
@@ -73,7 +85,11 @@ class ShadeWriteBatcher:
         else:
             self._schedule_timer()
 
-        await future
+        # Single-shade writes from covers skip the gather wrapper future.
+        if len(futures) == 1:
+            await futures[0]
+        else:
+            await asyncio.gather(*futures)
 
     async def async_flush(self) -> None:
         """Flush the current queue immediately."""
@@ -0,0 +1,154 @@
+import asyncio
+import importlib.util
+from pathlib import Path
+import sys
+import types
+from typing import Any
+
+import orjson
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PACKAGE_ROOT = PROJECT_ROOT / "custom_components" / "crestron_home"
+PACKAGE_NAME = "custom_components.crestron_home"
+
+# Ensure package namespace exists for dynamic imports.
+if "custom_components" not in sys.modules:
+    custom_components_pkg = types.ModuleType("custom_components")
+    custom_components_pkg.__path__ = [str(PROJECT_ROOT / "custom_components")]
+    sys.modules["custom_components"] = custom_components_pkg
+
+# A bare package stub is only needed to resolve api.py's relative imports. It is
+# removed again below so later test modules can load the real package.
+_STUB_PACKAGE = PACKAGE_NAME not in sys.modules
+if _STUB_PACKAGE:
+    crestron_home_pkg = types.ModuleType(PACKAGE_NAME)
+    crestron_home_pkg.__path__ = [str(PACKAGE_ROOT)]
+    sys.modules[PACKAGE_NAME] = crestron_home_pkg
+
+# Minimal Home Assistant stubs required by the API client module. Reuse any
+# stubs other test modules already registered so their attributes survive.
+homeassistant = sys.modules.setdefault("homeassistant", types.ModuleType("homeassistant"))
+if not hasattr(homeassistant, "__path__"):
+    homeassistant.__path__ = []
+
+core_module = sys.modules.setdefault(
+    "homeassistant.core", types.ModuleType("homeassistant.core")
+)
+if not hasattr(core_module, "HomeAssistant"):
+    core_module.HomeAssistant = type("HomeAssistant", (), {})
+homeassistant.core = core_module
+
+helpers_module = sys.modules.setdefault(
+    "homeassistant.helpers", types.ModuleType("homeassistant.helpers")
+)
+if not hasattr(helpers_module, "__path__"):
+    helpers_module.__path__ = []
+homeassistant.helpers = helpers_module
+
+aiohttp_client_module = sys.modules.setdefault(
+    "homeassistant.helpers.aiohttp_client",
+    types.ModuleType("homeassistant.helpers.aiohttp_client"),
+)
+if not hasattr(aiohttp_client_module, "async_get_clientsession"):
+
+    def _async_client_session(*_args, **_kwargs):  # pragma: no cover - import stub
+        raise NotImplementedError
+
+    aiohttp_client_module.async_create_clientsession = _async_client_session
+    aiohttp_client_module.async_get_clientsession = _async_client_session
+helpers_module.aiohttp_client = aiohttp_client_module
+
+api_spec = importlib.util.spec_from_file_location(
+    f"{PACKAGE_NAME}.api", PACKAGE_ROOT / "api.py"
+)
+api = importlib.util.module_from_spec(api_spec)
+assert api_spec and api_spec.loader
+sys.modules[api_spec.name] = api
+api_spec.loader.exec_module(api)
+
+from custom_components.crestron_home.const import (  # noqa: E402
+    HEADER_AUTH_KEY,
+    MIME_TYPE_JSON,
+    PATH_LOGIN,
+)
+
+ApiClient = api.ApiClient
+
+if _STUB_PACKAGE:
+    del sys.modules[PACKAGE_NAME]
+    del sys.modules[api_spec.name]
+
+
+class _FakeResponse:
+    def __init__(self, status: int, payload: Any) -> None:
+        self.status = status
+        self.content_type = MIME_TYPE_JSON
+        self._body = orjson.dumps(payload)
+
+    async def __aenter__(self) -> "_FakeResponse":
+        return self
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+    def raise_for_status(self) -> None:
+        assert self.status < 400
+
+    async def read(self) -> bytes:
+        return self._body
+
+
+class _FakeSession:
+    """Controller stand-in that rejects the expired key until a new login."""
+
+    def __init__(self) -> None:
+        self.login_calls = 0
+        self.request_keys: list[str] = []
+
+    def get(
+        self, url: str, *, headers: dict[str, str], timeout: Any
+    ) -> "_LoginContext":
+        assert url.endswith(PATH_LOGIN)
+        return _LoginContext(self)
+
+    def request(
+        self, method: str, url: str, *, headers: dict[str, str], timeout: Any
+    ) -> _FakeResponse:
+        auth_key = headers[HEADER_AUTH_KEY]
+        self.request_keys.append(auth_key)
+        if auth_key == "expired":
+            return _FakeResponse(401, {})
+        return _FakeResponse(200, [{"id": 1}])
+
+
+class _LoginContext:
+    def __init__(self, session: _FakeSession) -> None:
+        self._session = session
+
+    async def __aenter__(self) -> _FakeResponse:
+        self._session.login_calls += 1
+        # Give the other rejected requests time to queue up behind the lock.
+        await asyncio.sleep(0.01)
+        return _FakeResponse(200, {"authkey": "fresh"})
+
+    async def __aexit__(self, *_exc: Any) -> None:
+        return None
+
+
+def test_concurrent_requests_share_one_reauthentication() -> None:
+    """Requests rejected with the same expired key should log in only once."""
+
+    async def _async_test() -> None:
+        session = _FakeSession()
+        client = ApiClient(types.SimpleNamespace(), "controller.local", "token")
+        client._session = session
+        client._set_auth_key("expired")
+
+        results = await asyncio.gather(*(client.async_get_shades() for _ in range(5)))
+
+        assert session.login_calls == 1
+        assert results == [[{"id": 1}]] * 5
+        assert session.request_keys.count("expired") == 5
+        assert session.request_keys.count("fresh") == 5
+
+    asyncio.run(_async_test())
@@ -101,6 +101,9 @@ sys.modules["homeassistant.util.dt"] = dt_module
 
 exceptions_module = types.ModuleType("homeassistant.exceptions")
 exceptions_module.HomeAssistantError = type("HomeAssistantError", (Exception,), {})
+exceptions_module.ConfigEntryNotReady = type(
+    "ConfigEntryNotReady", (exceptions_module.HomeAssistantError,), {}
+)
 homeassistant.exceptions = exceptions_module
 sys.modules["homeassistant.exceptions"] = exceptions_module
 
@@ -39,8 +39,10 @@ assert const_spec and const_spec.loader
 sys.modules[const_spec.name] = const
 const_spec.loader.exec_module(const)
 
+CalibrationCollection = calibration.CalibrationCollection
 DEFAULT_ANCHORS = calibration.DEFAULT_ANCHORS
 InvalidCalibrationError = calibration.InvalidCalibrationError
+ShadeCalibration = calibration.ShadeCalibration
 pct_to_raw = calibration.pct_to_raw
 raw_to_pct = calibration.raw_to_pct
 validate_anchors = calibration.validate_anchors
@@ -130,3 +132,39 @@ def test_round_trip_custom_curve() -> None:
     assert raw_value == 9200
     assert raw_to_pct(raw_value, anchors, False) == 23
 
+
+def test_shade_calibration_lookup_matches_interpolation() -> None:
+    """The per-calibration lookup table should agree with pct_to_raw."""
+
+    calibration = ShadeCalibration(
+        anchors=validate_anchors(
+            [
+                {"pc": 0, "raw": 500},
+                {"pc": 30, "raw": 12000},
+                {"pc": 60, "raw": 40000},
+                {"pc": 100, "raw": CAL_ANCHOR_RAW_MAX},
+            ]
+        )
+    )
+
+    for invert in (False, True):
+        for pct in range(-5, 106):
+            assert calibration.pct_to_raw(pct, invert) == pct_to_raw(
+                pct, calibration.anchors, invert
+            )
+
+
+def test_calibration_collection_incremental_updates() -> None:
+    """Collection copies should replace, add, and remove shade calibrations."""
+
+    custom = ShadeCalibration(invert_override=True)
+    collection = CalibrationCollection(False, {"1": custom})
+
+    updated = collection.with_shades({"1": None, "2": custom})
+    assert updated.per_shade == {"2": custom}
+    assert collection.per_shade == {"1": custom}
+    assert updated.for_shade("1") == ShadeCalibration()
+
+    inverted = updated.with_global_invert(True)
+    assert inverted.global_invert is True
+    assert inverted.per_shade is updated.per_shade
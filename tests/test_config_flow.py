@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+from datetime import datetime, timezone
 import json
 from pathlib import Path
 import sys
@@ -140,8 +141,17 @@ sys.modules["homeassistant.helpers.update_coordinator"] = update_coordinator_mod
 sys.modules["homeassistant.helpers.storage"] = storage_module
 
 
+from custom_components.crestron_home import _options_require_reload  # noqa: E402
+from custom_components.crestron_home.const import (  # noqa: E402
+    CONF_INVERT,
+    OPT_CALIBRATION,
+    OPT_PREDICTIVE_STOP,
+)
+from custom_components.crestron_home.coordinator import Shade  # noqa: E402
 from custom_components.crestron_home.config_flow import (  # noqa: E402
     CrestronHomeOptionsFlowHandler,
+    _host_from_input,
+    _selector_value,
 )
 
 
@@ -153,6 +163,39 @@ class _SelectorValue:
     label: str
 
 
+def test_host_from_input_strips_url_parts() -> None:
+    """Pasted URLs should reduce to a lower-cased host[:port]."""
+
+    assert _host_from_input("  10.0.0.5  ") == "10.0.0.5"
+    assert _host_from_input("https://admin@10.0.0.5/") == "10.0.0.5"
+    assert _host_from_input("https://10.0.0.5?x=1") == "10.0.0.5"
+    assert _host_from_input("https://10.0.0.5:8443#top") == "10.0.0.5:8443"
+    assert _host_from_input("https://Crestron.Local/cws") == "crestron.local"
+    assert _host_from_input("https://[FE80::1]:443/") == "[fe80::1]:443"
+
+
+def test_predictive_stop_toggle_applies_without_reload() -> None:
+    """Only toggling predictive stop, even on a fresh entry, should stay live."""
+
+    assert not _options_require_reload(
+        {}, {CONF_INVERT: False, OPT_PREDICTIVE_STOP: False}
+    )
+    assert not _options_require_reload(
+        {CONF_INVERT: True, OPT_PREDICTIVE_STOP: True},
+        {CONF_INVERT: True, OPT_PREDICTIVE_STOP: False},
+    )
+
+
+def test_other_option_changes_require_reload() -> None:
+    """Changing the global invert or calibration should reload the entry."""
+
+    assert _options_require_reload({}, {CONF_INVERT: True, OPT_PREDICTIVE_STOP: True})
+    assert _options_require_reload(
+        {CONF_INVERT: False},
+        {CONF_INVERT: False, OPT_CALIBRATION: {"shade-1": {}}},
+    )
+
+
 def test_normalize_shade_id_from_string() -> None:
     """A plain string should be returned unchanged after stripping."""
 
@@ -194,10 +237,7 @@ def test_selector_value_from_mapping() -> None:
     """Selector helper should read the value entry when provided."""
 
     assert (
-        CrestronHomeOptionsFlowHandler._selector_value(
-            {"value": "option-123", "label": "Option"}
-        )
-        == "option-123"
+        _selector_value({"value": "option-123", "label": "Option"}) == "option-123"
     )
 
 
@@ -205,7 +245,7 @@ def test_selector_value_from_object_attribute() -> None:
     """Selector helper should read the value attribute on option objects."""
 
     option = _SelectorValue("option-456", "Label")
-    assert CrestronHomeOptionsFlowHandler._selector_value(option) == "option-456"
+    assert _selector_value(option) == "option-456"
 
 
 def test_invert_from_form_handles_selector_mapping() -> None:
@@ -278,3 +318,66 @@ def test_options_root_menu_has_translations() -> None:
 
     assert descriptions_strings["select_shade"] == "Open the manual calibration editor for one shade."
     assert descriptions_en["select_shade"] == "Open the manual calibration editor for one shade."
+
+
+def test_assisted_stage_skips_only_after_writes_were_sent() -> None:
+    """Resubmitting the same target should restage unless writes already went out."""
+
+    def _shade(shade_id: str, status: str) -> Shade:
+        return Shade(
+            id=shade_id,
+            name=shade_id,
+            position=0,
+            connection_status=status,
+            room_id=None,
+            updated_at=datetime(2024, 1, 1, tzinfo=timezone.utc),
+            raw={},
+        )
+
+    sent: list[list[tuple[str, int]]] = []
+
+    class _Batcher:
+        async def enqueue_many(self, items):
+            sent.append(list(items))
+
+    coordinator = types.SimpleNamespace(
+        data={"shade-1": _shade("shade-1", "offline")},
+        burst=lambda: None,
+    )
+    config_entry = config_entries.ConfigEntry()
+    config_entry.options = {}
+    config_entry.entry_id = "test-entry"
+    config_entry.runtime_data = types.SimpleNamespace(
+        coordinator=coordinator, batcher=_Batcher()
+    )
+
+    handler = CrestronHomeOptionsFlowHandler(config_entry)
+    handler.hass = types.SimpleNamespace(data={})
+    handler.async_show_form = lambda **kwargs: kwargs  # type: ignore[assignment]
+    handler._assisted_group_id = "group-1"
+    handler._assisted_members = ["shade-1"]
+    handler._assisted_target_percent = 40
+
+    submit = {"mode": "automatic", "target_percent": 40, "action": "stage"}
+
+    async def _async_test() -> None:
+        # Nothing is sent while the only member is offline, so resubmitting
+        # the same target retries the stage.
+        await handler.async_step_assisted_calibration_stage()
+        await handler.async_step_assisted_calibration_target(dict(submit))
+        assert sent == []
+
+        coordinator.data = {"shade-1": _shade("shade-1", "online")}
+        await handler.async_step_assisted_calibration_target(dict(submit))
+        assert len(sent) == 1
+
+        # The same target with the same online members is not sent again.
+        await handler.async_step_assisted_calibration_target(dict(submit))
+        assert len(sent) == 1
+
+        await handler.async_step_assisted_calibration_target(
+            {**submit, "target_percent": 60}
+        )
+        assert len(sent) == 2
+
+    asyncio.run(_async_test())
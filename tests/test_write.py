@@ -86,7 +86,7 @@ def test_batcher_deduplicates_latest_position() -> None:
         callback_calls: list[int] = []
 
         class _Client:
-            async def async_set_shade_positions(self, items, *, retry: bool = True):
+            async def async_set_shade_positions(self, items):
                 calls.append(list(items))
                 return ShadeCommandResponse(status="success", results={})
 
@@ -114,7 +114,7 @@ def test_batcher_partial_failure_propagates() -> None:
         hass = FakeHass(loop)
 
         class _Client:
-            async def async_set_shade_positions(self, items, *, retry: bool = True):
+            async def async_set_shade_positions(self, items):
                 return ShadeCommandResponse(
                     status="partial",
                     results={
@@ -146,7 +146,7 @@ def test_batcher_flush_callback_receives_payload() -> None:
         flush_calls: list[tuple[list[dict[str, int]], str | None]] = []
 
         class _Client:
-            async def async_set_shade_positions(self, items, *, retry: bool = True):
+            async def async_set_shade_positions(self, items):
                 return ShadeCommandResponse(status="success", results={})
 
         def _on_flush(items, status):
@@ -179,7 +179,7 @@ def test_batcher_coalesces_group_stage() -> None:
         calls: list[list[dict[str, int]]] = []
 
         class _Client:
-            async def async_set_shade_positions(self, items, *, retry: bool = True):
+            async def async_set_shade_positions(self, items):
                 calls.append(list(items))
                 return ShadeCommandResponse(status="success", results={})
 
@@ -209,7 +209,7 @@ def test_batcher_splits_large_payload() -> None:
         calls: list[list[dict[str, int]]] = []
 
         class _Client:
-            async def async_set_shade_positions(self, items, *, retry: bool = True):
+            async def async_set_shade_positions(self, items):
                 calls.append(list(items))
                 return ShadeCommandResponse(status="success", results={})
 
@@ -227,3 +227,33 @@ def test_batcher_splits_large_payload() -> None:
         assert all_ids.count("shade-19") == 1
 
     asyncio.run(_async_test())
+
+
+def test_batcher_enqueue_many_sends_single_batch() -> None:
+    """Enqueuing several shades at once should share one controller post."""
+
+    async def _async_test() -> None:
+        loop = asyncio.get_running_loop()
+        hass = FakeHass(loop)
+        calls: list[list[dict[str, int]]] = []
+
+        class _Client:
+            async def async_set_shade_positions(self, items):
+                calls.append(list(items))
+                return ShadeCommandResponse(status="success", results={})
+
+        batcher = ShadeWriteBatcher(hass, _Client(), debounce_ms=50)
+
+        await batcher.enqueue_many(
+            [("shade-1", 1000), ("shade-2", 2000), ("shade-1", 3000)]
+        )
+        await batcher.enqueue_many([])
+
+        assert calls == [
+            [
+                {"id": "shade-1", "position": 3000},
+                {"id": "shade-2", "position": 2000},
+            ]
+        ]
+
+    asyncio.run(_async_test())